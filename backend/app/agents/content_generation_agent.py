@@ -17,6 +17,34 @@ import json
 
 logger = logging.getLogger(__name__)
 
+def _lower_text(value: Any) -> str:
+    """Lowercased string field from vehicle data; missing or non-string values give an empty string"""
+    return value.lower() if isinstance(value, str) else ""
+
+
+# Title statuses and conditions that require a buyer disclosure
+DISCLOSED_TITLE_STATUSES = frozenset({"rebuilt", "salvage", "junk"})
+DISCLOSED_CONDITIONS = frozenset({"fair", "poor"})
+
+# Calls to action by guideline cta_style; unknown styles fall back to casual
+CTA_MESSAGES = {
+    "friendly": (
+        "📱 Message me for more details!",
+        "📞 Call or text for quick response",
+        "🚗 Test drive available by appointment"
+    ),
+    "direct": (
+        "Contact for details",
+        "Call for appointment",
+        "Serious buyers only"
+    ),
+    "casual": (
+        "Hit me up for details!",
+        "Text me for quick response",
+        "Down to show the car anytime"
+    ),
+}
+
 
 class ContentGenerationAgent(BaseAgent):
     """Content Generation Agent - Creates optimized listing content"""
@@ -48,14 +76,6 @@ class ContentGenerationAgent(BaseAgent):
                 "cta_style": "casual"
             }
         }
-        
-        # Common feature keywords
-        self.feature_keywords = {
-            "interior": ["leather", "cloth", "heated seats", "cooled seats", "navigation", "bluetooth", "backup camera", "sunroof", "moonroof"],
-            "exterior": ["alloy wheels", "steel wheels", "fog lights", "led lights", "tinted windows", "spoiler", "tow hitch"],
-            "safety": ["airbags", "abs", "traction control", "stability control", "backup sensors", "blind spot monitoring"],
-            "performance": ["turbo", "v6", "v8", "4-cylinder", "hybrid", "electric", "all-wheel drive", "4wd"]
-        }
     
     async def process(self, input_data: Dict[str, Any]) -> AgentOutput:
         """
@@ -250,43 +270,17 @@ class ContentGenerationAgent(BaseAgent):
         Generate feature bullet points
         """
         features = vehicle_data.get("features", [])
-        bullets = []
-        
-        for feature in features:
-            # Categorize features
-            for category, keywords in self.feature_keywords.items():
-                if any(keyword in feature.lower() for keyword in keywords):
-                    bullets.append(f"• {feature.title()}")
-                    break
-            else:
-                bullets.append(f"• {feature.title()}")
-        
-        return bullets[:10]  # Limit to 10 bullets
+        
+        # Every feature becomes a bullet whichever category it matches, so only
+        # the first 10 (the limit) need formatting
+        return [f"• {feature.title()}" for feature in features[:10]]
     
     def _generate_ctas(self, platform: str, guidelines: Dict) -> List[str]:
         """
         Generate platform-specific calls to action
         """
         cta_style = guidelines.get("cta_style", "friendly")
-        
-        if cta_style == "friendly":
-            return [
-                "📱 Message me for more details!",
-                "📞 Call or text for quick response",
-                "🚗 Test drive available by appointment"
-            ]
-        elif cta_style == "direct":
-            return [
-                "Contact for details",
-                "Call for appointment",
-                "Serious buyers only"
-            ]
-        else:  # casual
-            return [
-                "Hit me up for details!",
-                "Text me for quick response",
-                "Down to show the car anytime"
-            ]
+        return list(CTA_MESSAGES.get(cta_style, CTA_MESSAGES["casual"]))
     
     def _generate_disclosures(self, vehicle_data: Dict) -> List[str]:
         """
@@ -294,18 +288,16 @@ class ContentGenerationAgent(BaseAgent):
         """
         disclosures = []
 
-        title_status_raw = vehicle_data.get("title_status")
-        title_status = (str(title_status_raw) if title_status_raw and isinstance(title_status_raw, str) else "").lower()
-        if title_status in ["rebuilt", "salvage", "junk"]:
+        title_status = _lower_text(vehicle_data.get("title_status"))
+        if title_status in DISCLOSED_TITLE_STATUSES:
             disclosures.append(f"⚠️ {title_status.title()} title - Vehicle has been previously damaged/repaired")
         
         mileage = vehicle_data.get("mileage", 0)
         if mileage > 150000:
             disclosures.append("⚠️ High mileage vehicle")
         
-        condition_raw = vehicle_data.get("condition")
-        condition = (str(condition_raw) if condition_raw and isinstance(condition_raw, str) else "").lower()
-        if condition in ["fair", "poor"]:
+        condition = _lower_text(vehicle_data.get("condition"))
+        if condition in DISCLOSED_CONDITIONS:
             disclosures.append(f"⚠️ {condition.title()} condition - Some wear and tear")
         
         # Standard disclosures
@@ -349,10 +341,8 @@ class ContentGenerationAgent(BaseAgent):
         hashtags = []
         
         year = vehicle_data.get("year", "")
-        make_raw = vehicle_data.get("make")
-        make = (str(make_raw) if make_raw and isinstance(make_raw, str) else "").lower()
-        model_raw = vehicle_data.get("model")
-        model = (str(model_raw) if model_raw and isinstance(model_raw, str) else "").lower()
+        make = _lower_text(vehicle_data.get("make"))
+        model = _lower_text(vehicle_data.get("model"))
         
         if year:
             hashtags.append(f"#{year}")
@@ -375,10 +365,8 @@ class ContentGenerationAgent(BaseAgent):
         keywords = []
         
         year = vehicle_data.get("year", "")
-        make_raw = vehicle_data.get("make")
-        make = (str(make_raw) if make_raw and isinstance(make_raw, str) else "").lower()
-        model_raw = vehicle_data.get("model")
-        model = (str(model_raw) if model_raw and isinstance(model_raw, str) else "").lower()
+        make = _lower_text(vehicle_data.get("make"))
+        model = _lower_text(vehicle_data.get("model"))
         
         if year:
             keywords.append(str(year))
@@ -399,13 +387,12 @@ class ContentGenerationAgent(BaseAgent):
         Check SEO optimization of content
         """
         year = str(vehicle_data.get("year", ""))
-        make_raw = vehicle_data.get("make")
-        make = (str(make_raw) if make_raw and isinstance(make_raw, str) else "").lower()
-        model_raw = vehicle_data.get("model")
-        model = (str(model_raw) if model_raw and isinstance(model_raw, str) else "").lower()
+        make = _lower_text(vehicle_data.get("make"))
+        model = _lower_text(vehicle_data.get("model"))
         
         seo_score = 0
         issues = []
+        title_lower = title.lower()
         
         # Check if year is in title
         if year and year in title:
@@ -414,13 +401,13 @@ class ContentGenerationAgent(BaseAgent):
             issues.append("Year not in title")
         
         # Check if make is in title
-        if make and make in title.lower():
+        if make and make in title_lower:
             seo_score += 25
         else:
             issues.append("Make not in title")
         
         # Check if model is in title
-        if model and model in title.lower():
+        if model and model in title_lower:
             seo_score += 25
         else:
             issues.append("Model not in title")
@@ -2,19 +2,36 @@
 Analytics API endpoints for data collection and learning
 """
 
-from fastapi import APIRouter, HTTPException, Depends
-from pydantic import BaseModel
-from typing import Dict, Any, Optional
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Request, status
+from typing import Dict, Any, Optional, Type, TypeVar
 from datetime import datetime
 import logging
-from app.core.database import get_sync_db as get_db
-from sqlalchemy.orm import Session
-from app.api.v1.auth import get_current_user
+import msgspec
+from app.api.v1.auth import get_current_user, get_optional_user
+from app.models.user import User
+from app.services.data_collection_service import data_collection_service, EVENT_TYPES_BY_VALUE
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-class UserInteractionRequest(BaseModel):
+# Tracking bodies are msgspec Structs: JSON decoding and validation happen
+# in one C pass instead of json.loads followed by Pydantic validation
+StructT = TypeVar("StructT", bound=msgspec.Struct)
+
+def _decode_body(body: bytes, struct_type: Type[StructT]) -> StructT:
+    """Decode and validate a JSON request body"""
+    try:
+        return msgspec.json.decode(body, type=struct_type)
+    except msgspec.ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except msgspec.DecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON body")
+
+def _verified_user_id(current_user: Optional[User]) -> Optional[str]:
+    """Id of the authenticated caller; a userId in the body is never trusted"""
+    return current_user.user_id if current_user else None
+
+class UserInteractionRequest(msgspec.Struct, kw_only=True):
     userId: Optional[str] = None
     sessionId: str
     action: str
@@ -22,7 +39,7 @@ class UserInteractionRequest(BaseModel):
     data: Dict[str, Any]
     metadata: Optional[Dict[str, Any]] = None
 
-class CarAnalysisRequest(BaseModel):
+class CarAnalysisRequest(msgspec.Struct, kw_only=True):
     userId: Optional[str] = None
     sessionId: str
     carDetails: Dict[str, str]
@@ -32,7 +49,7 @@ class CarAnalysisRequest(BaseModel):
     confidenceScore: float
     timestamp: str
 
-class ListingGenerationRequest(BaseModel):
+class ListingGenerationRequest(msgspec.Struct, kw_only=True):
     userId: Optional[str] = None
     sessionId: str
     carAnalysisId: str
@@ -41,55 +58,51 @@ class ListingGenerationRequest(BaseModel):
     finalPrice: str
     timestamp: str
 
-@router.post("/analytics/track-interaction")
+async def _record_interaction(request: UserInteractionRequest, user_id: Optional[str]):
+    """Record a tracked interaction after the response has been sent"""
+    logger.info(f"📊 User interaction tracked: {request.action}")
+    logger.info(f"Session: {request.sessionId}, User: {user_id or 'anonymous'}")
+    
+    event_type = EVENT_TYPES_BY_VALUE.get(request.action)
+    if event_type is None:
+        # Free-form actions are logged only
+        return
+    
+    await data_collection_service.track_event(
+        event_type,
+        session_id=request.sessionId,
+        user_id=user_id,
+        properties=request.data,
+        metadata=request.metadata
+    )
+
+@router.post("/analytics/track-interaction", status_code=status.HTTP_202_ACCEPTED)
 async def track_user_interaction(
-    request: UserInteractionRequest,
-    current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    http_request: Request,
+    background: BackgroundTasks,
+    current_user: Optional[User] = Depends(get_optional_user)
 ):
     """
     Track user interactions for analytics and learning
     """
-    try:
-        # Store interaction data
-        interaction_data = {
-            "user_id": current_user.get("user_id") if current_user else None,
-            "session_id": request.sessionId,
-            "action": request.action,
-            "timestamp": request.timestamp,
-            "data": request.data,
-            "metadata": request.metadata or {},
-            "created_at": datetime.now()
-        }
-        
-        # In a real implementation, you'd save this to your database
-        # For now, we'll log it for demonstration
-        logger.info(f"📊 User interaction tracked: {request.action}")
-        logger.info(f"Session: {request.sessionId}, User: {current_user.get('user_id') if current_user else 'anonymous'}")
-        
-        return {
-            "success": True,
-            "message": "Interaction tracked successfully",
-            "interaction_id": f"int_{datetime.now().timestamp()}"
-        }
-        
-    except Exception as e:
-        logger.error(f"Failed to track interaction: {e}")
-        raise HTTPException(status_code=500, detail="Failed to track interaction")
+    request = _decode_body(await http_request.body(), UserInteractionRequest)
+    user_id = _verified_user_id(current_user)
+    background.add_task(_record_interaction, request, user_id)
+    return {"accepted": True}
 
 @router.post("/analytics/save-car-analysis")
 async def save_car_analysis(
-    request: CarAnalysisRequest,
-    current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    http_request: Request,
+    current_user: Optional[User] = Depends(get_optional_user)
 ):
     """
     Save car analysis data for learning and training
     """
+    request = _decode_body(await http_request.body(), CarAnalysisRequest)
     try:
         # Store car analysis data
         analysis_data = {
-            "user_id": current_user.get("user_id") if current_user else None,
+            "user_id": _verified_user_id(current_user),
             "session_id": request.sessionId,
             "car_details": request.carDetails,
             "analysis_result": request.analysisResult,
@@ -118,46 +131,28 @@ async def save_car_analysis(
         logger.error(f"Failed to save car analysis: {e}")
         raise HTTPException(status_code=500, detail="Failed to save car analysis")
 
-@router.post("/analytics/save-listing-generation")
+async def _record_listing_generation(request: ListingGenerationRequest, user_id: Optional[str]):
+    """Record a generated listing after the response has been sent"""
+    logger.info(f"📊 Listing generation saved for platform: {request.platform}")
+    logger.info(f"Price: {request.finalPrice}, Analysis ID: {request.carAnalysisId}, User: {user_id or 'anonymous'}")
+
+@router.post("/analytics/save-listing-generation", status_code=status.HTTP_202_ACCEPTED)
 async def save_listing_generation(
-    request: ListingGenerationRequest,
-    current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    http_request: Request,
+    background: BackgroundTasks,
+    current_user: Optional[User] = Depends(get_optional_user)
 ):
     """
     Save listing generation data for learning and training
     """
-    try:
-        # Store listing generation data
-        listing_data = {
-            "user_id": current_user.get("user_id") if current_user else None,
-            "session_id": request.sessionId,
-            "car_analysis_id": request.carAnalysisId,
-            "generated_listing": request.generatedListing,
-            "platform": request.platform,
-            "final_price": request.finalPrice,
-            "timestamp": request.timestamp,
-            "created_at": datetime.now()
-        }
-        
-        # In a real implementation, you'd save this to your database
-        # For now, we'll log it for demonstration
-        logger.info(f"📊 Listing generation saved for platform: {request.platform}")
-        logger.info(f"Price: {request.finalPrice}, Analysis ID: {request.carAnalysisId}")
-        
-        return {
-            "success": True,
-            "message": "Listing generation saved successfully"
-        }
-        
-    except Exception as e:
-        logger.error(f"Failed to save listing generation: {e}")
-        raise HTTPException(status_code=500, detail="Failed to save listing generation")
+    request = _decode_body(await http_request.body(), ListingGenerationRequest)
+    user_id = _verified_user_id(current_user)
+    background.add_task(_record_listing_generation, request, user_id)
+    return {"accepted": True}
 
 @router.get("/analytics/user-stats")
 async def get_user_stats(
-    current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user)
 ):
     """
     Get user analytics and statistics
@@ -176,7 +171,8 @@ async def get_user_stats(
         
         return {
             "success": True,
-            "stats": user_stats
+            "stats": user_stats,
+            "activity": await data_collection_service.get_user_analytics(current_user.user_id)
         }
         
     except Exception as e:
@@ -185,8 +181,7 @@ async def get_user_stats(
 
 @router.get("/analytics/learning-data")
 async def get_learning_data(
-    current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user)
 ):
     """
     Get anonymized learning data for AI training
@@ -24,6 +24,7 @@ router = APIRouter()
 
 # Security
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 # Temporary in-memory storage for testing
@@ -115,6 +116,12 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
         logger.error(f"Database error: {e}")
         raise HTTPException(status_code=401, detail="User not found")
 
+async def get_optional_user(credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security), db: AsyncSession = Depends(get_db)) -> Optional[User]:
+    """Get the current user if a bearer token was sent, skipping token verification for anonymous calls"""
+    if credentials is None:
+        return None
+    return await get_current_user(credentials, db)
+
 # API Endpoints
 @router.post("/register", response_model=TokenResponse)
 async def register(user_data: UserRegister, db: AsyncSession = Depends(get_db)):
@@ -2,20 +2,51 @@
 Global Empowerment Platform - Community Feed API
 Handles posts, likes, comments, shares
 """
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, desc
-from typing import List, Optional
+from sqlalchemy import select, update, delete, func, desc, tuple_, bindparam
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import array, insert
+from typing import List, Optional, Tuple
 from datetime import datetime
+import base64
 import uuid
+import orjson
 
 from app.core.database import get_db
 from app.models.gep_models import GEPPost, GEPPostLike, GEPPostComment, GEPMember
 from app.utils.auth import get_current_user
 from pydantic import BaseModel
 
+# The app's default ORJSONResponse serializes UUID and datetime natively, so handlers return them as-is
 router = APIRouter()
 
+# Keyset pagination: the next page's cursor is returned in this header so the
+# response body stays a plain list
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Member lookup run by every write endpoint; built once so its compiled form
+# (and the asyncpg prepared statement behind it) is reused across requests
+MEMBER_BY_USER_ID = select(GEPMember).where(GEPMember.user_id == bindparam("user_id"))
+
+# Unpaginated comment lists are streamed in batches of this many rows
+COMMENT_STREAM_BATCH_SIZE = 100
+
+
+def _encode_cursor(created_at: datetime, row_id: uuid.UUID) -> str:
+    """Encode the (created_at, id) position of the last row on a page"""
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{row_id}".encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """Decode a cursor produced by _encode_cursor"""
+    try:
+        created_at, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), uuid.UUID(row_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
 
 class PostCreate(BaseModel):
     content: Optional[str] = None
@@ -27,8 +58,8 @@ class PostCreate(BaseModel):
 
 
 class PostResponse(BaseModel):
-    id: str
-    member_id: str
+    id: uuid.UUID
+    member_id: uuid.UUID
     content: Optional[str]
     image_urls: Optional[List[str]]
     video_url: Optional[str]
@@ -46,7 +77,7 @@ class PostResponse(BaseModel):
 
 class CommentCreate(BaseModel):
     content: str
-    parent_comment_id: Optional[str] = None
+    parent_comment_id: Optional[uuid.UUID] = None
 
 
 @router.post("/posts", response_model=PostResponse)
@@ -59,33 +90,34 @@ async def create_post(
     current_user = get_current_user(request)
     # Get or create member profile
     user_id = current_user.get("sub") or current_user.get("id")
-    result = await db.execute(
-        select(GEPMember).where(GEPMember.user_id == uuid.UUID(user_id))
-    )
+    result = await db.execute(MEMBER_BY_USER_ID, {"user_id": uuid.UUID(user_id)})
     member = result.scalar_one_or_none()
     
     if not member:
         raise HTTPException(status_code=404, detail="Member profile not found. Please complete your profile.")
     
     # Create post
-    new_post = GEPPost(
-        member_id=member.id,
-        content=post_data.content,
-        image_urls=post_data.image_urls or [],
-        video_url=post_data.video_url,
-        post_type=post_data.post_type,
-        hashtags=post_data.hashtags or [],
-        mentions=post_data.mentions or []
+    # INSERT ... RETURNING loads server defaults (created_at) without a refresh SELECT
+    result = await db.execute(
+        insert(GEPPost)
+        .values(
+            member_id=member.id,
+            content=post_data.content,
+            image_urls=post_data.image_urls or [],
+            video_url=post_data.video_url,
+            post_type=post_data.post_type,
+            hashtags=post_data.hashtags or [],
+            mentions=post_data.mentions or []
+        )
+        .returning(GEPPost)
     )
-    
-    db.add(new_post)
+    new_post = result.scalar_one()
     await db.commit()
-    await db.refresh(new_post)
     
     # Return with member info
     return {
-        "id": str(new_post.id),
-        "member_id": str(new_post.member_id),
+        "id": new_post.id,
+        "member_id": new_post.member_id,
         "content": new_post.content,
         "image_urls": new_post.image_urls or [],
         "video_url": new_post.video_url,
@@ -96,7 +128,7 @@ async def create_post(
         "shares_count": new_post.shares_count,
         "created_at": new_post.created_at,
         "member": {
-            "id": str(member.id),
+            "id": member.id,
             "business_name": member.business_name,
             "profile_image_url": member.profile_image_url
         }
@@ -105,25 +137,32 @@ async def create_post(
 
 @router.get("/feed", response_model=List[PostResponse])
 async def get_feed(
-    limit: int = 20,
-    offset: int = 0,
+    response: Response,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    hashtag: Optional[str] = None,
     db: AsyncSession = Depends(get_db)
 ):
-    """Get community feed (latest posts)"""
-    result = await db.execute(
+    """Get community feed (latest posts), paginated by the X-Next-Cursor header"""
+    query = (
         select(GEPPost, GEPMember)
         .join(GEPMember, GEPPost.member_id == GEPMember.id)
         .where(GEPPost.is_published == True)
-        .order_by(desc(GEPPost.created_at))
+        .order_by(desc(GEPPost.created_at), desc(GEPPost.id))
         .limit(limit)
-        .offset(offset)
     )
+    if cursor:
+        query = query.where(tuple_(GEPPost.created_at, GEPPost.id) < tuple_(*_decode_cursor(cursor)))
+    if hashtag:
+        # hashtags @> ARRAY[:hashtag] is served by the GIN index
+        query = query.where(GEPPost.hashtags.op('@>')(array([hashtag])))
     
-    posts = []
-    for post, member in result.all():
-        posts.append({
-            "id": str(post.id),
-            "member_id": str(post.member_id),
+    result = await db.execute(query)
+    
+    posts = [
+        {
+            "id": post.id,
+            "member_id": post.member_id,
             "content": post.content,
             "image_urls": post.image_urls or [],
             "video_url": post.video_url,
@@ -134,18 +173,23 @@ async def get_feed(
             "shares_count": post.shares_count,
             "created_at": post.created_at,
             "member": {
-                "id": str(member.id),
+                "id": member.id,
                 "business_name": member.business_name,
                 "profile_image_url": member.profile_image_url
             }
-        })
+        }
+        for post, member in result
+    ]
+    
+    if len(posts) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = _encode_cursor(posts[-1]["created_at"], posts[-1]["id"])
     
     return posts
 
 
 @router.post("/posts/{post_id}/like")
 async def like_post(
-    post_id: str,
+    post_id: uuid.UUID,
     request: Request,
     db: AsyncSession = Depends(get_db)
 ):
@@ -153,51 +197,52 @@ async def like_post(
     """Like a post"""
     # Get member
     user_id = current_user.get("sub") or current_user.get("id")
-    result = await db.execute(
-        select(GEPMember).where(GEPMember.user_id == uuid.UUID(user_id))
-    )
+    result = await db.execute(MEMBER_BY_USER_ID, {"user_id": uuid.UUID(user_id)})
     member = result.scalar_one_or_none()
     if not member:
         raise HTTPException(status_code=404, detail="Member profile not found")
     
-    # Check if post exists
-    result = await db.execute(
-        select(GEPPost).where(GEPPost.id == uuid.UUID(post_id))
-    )
-    post = result.scalar_one_or_none()
-    if not post:
-        raise HTTPException(status_code=404, detail="Post not found")
-    
-    # Check if already liked
+    # Unlike if already liked
     result = await db.execute(
-        select(GEPPostLike).where(
-            GEPPostLike.post_id == uuid.UUID(post_id),
+        delete(GEPPostLike)
+        .where(
+            GEPPostLike.post_id == post_id,
             GEPPostLike.member_id == member.id
         )
+        .returning(GEPPostLike.id)
     )
-    existing_like = result.scalar_one_or_none()
+    liked = result.first() is None
     
-    if existing_like:
-        # Unlike
-        await db.delete(existing_like)
-        post.likes_count = max(0, post.likes_count - 1)
-        await db.commit()
-        return {"liked": False, "likes_count": post.likes_count}
+    if liked:
+        # Like - the post_id foreign key rejects missing posts; a concurrent like
+        # by the same member hits unique_post_like and is skipped
+        try:
+            result = await db.execute(
+                insert(GEPPostLike)
+                .values(post_id=post_id, member_id=member.id)
+                .on_conflict_do_nothing(constraint="unique_post_like")
+                .returning(GEPPostLike.id)
+            )
+        except IntegrityError:
+            await db.rollback()
+            raise HTTPException(status_code=404, detail="Post not found")
+        likes_count = GEPPost.likes_count + 1 if result.first() else GEPPost.likes_count
     else:
-        # Like
-        new_like = GEPPostLike(
-            post_id=uuid.UUID(post_id),
-            member_id=member.id
-        )
-        db.add(new_like)
-        post.likes_count += 1
-        await db.commit()
-        return {"liked": True, "likes_count": post.likes_count}
+        likes_count = func.greatest(GEPPost.likes_count - 1, 0)
+    
+    result = await db.execute(
+        update(GEPPost)
+        .where(GEPPost.id == post_id)
+        .values(likes_count=likes_count)
+        .returning(GEPPost.likes_count)
+    )
+    await db.commit()
+    return {"liked": liked, "likes_count": result.scalar_one()}
 
 
 @router.post("/posts/{post_id}/comments")
 async def create_comment(
-    post_id: str,
+    post_id: uuid.UUID,
     comment_data: CommentCreate,
     request: Request,
     db: AsyncSession = Depends(get_db)
@@ -206,38 +251,40 @@ async def create_comment(
     """Add a comment to a post"""
     # Get member
     user_id = current_user.get("sub") or current_user.get("id")
-    result = await db.execute(
-        select(GEPMember).where(GEPMember.user_id == uuid.UUID(user_id))
-    )
+    result = await db.execute(MEMBER_BY_USER_ID, {"user_id": uuid.UUID(user_id)})
     member = result.scalar_one_or_none()
     if not member:
         raise HTTPException(status_code=404, detail="Member profile not found")
     
-    # Check if post exists
-    result = await db.execute(
-        select(GEPPost).where(GEPPost.id == uuid.UUID(post_id))
-    )
-    post = result.scalar_one_or_none()
-    if not post:
-        raise HTTPException(status_code=404, detail="Post not found")
+    # Create comment - the post_id / parent_comment_id foreign keys reject missing targets
+    try:
+        result = await db.execute(
+            insert(GEPPostComment)
+            .values(
+                post_id=post_id,
+                member_id=member.id,
+                content=comment_data.content,
+                parent_comment_id=comment_data.parent_comment_id
+            )
+            .returning(GEPPostComment)
+        )
+    except IntegrityError:
+        await db.rollback()
+        detail = "Post or parent comment not found" if comment_data.parent_comment_id else "Post not found"
+        raise HTTPException(status_code=404, detail=detail)
+    new_comment = result.scalar_one()
     
-    # Create comment
-    new_comment = GEPPostComment(
-        post_id=uuid.UUID(post_id),
-        member_id=member.id,
-        content=comment_data.content,
-        parent_comment_id=uuid.UUID(comment_data.parent_comment_id) if comment_data.parent_comment_id else None
+    await db.execute(
+        update(GEPPost)
+        .where(GEPPost.id == post_id)
+        .values(comments_count=GEPPost.comments_count + 1)
     )
-    
-    db.add(new_comment)
-    post.comments_count += 1
     await db.commit()
-    await db.refresh(new_comment)
     
     return {
-        "id": str(new_comment.id),
+        "id": new_comment.id,
         "content": new_comment.content,
-        "member_id": str(member.id),
+        "member_id": member.id,
         "member_name": member.business_name,
         "created_at": new_comment.created_at
     }
@@ -245,27 +292,53 @@ async def create_comment(
 
 @router.get("/posts/{post_id}/comments")
 async def get_comments(
-    post_id: str,
+    post_id: uuid.UUID,
+    response: Response,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db)
 ):
-    """Get all comments for a post"""
-    result = await db.execute(
+    """Get comments for a post (all of them, streamed, unless limit is given), oldest first"""
+    query = (
         select(GEPPostComment, GEPMember)
         .join(GEPMember, GEPPostComment.member_id == GEPMember.id)
-        .where(GEPPostComment.post_id == uuid.UUID(post_id))
-        .order_by(GEPPostComment.created_at)
+        .where(GEPPostComment.post_id == post_id)
+        .order_by(GEPPostComment.created_at, GEPPostComment.id)
     )
+    if cursor:
+        query = query.where(tuple_(GEPPostComment.created_at, GEPPostComment.id) > tuple_(*_decode_cursor(cursor)))
+    if limit:
+        query = query.limit(limit)
     
-    comments = []
-    for comment, member in result.all():
-        comments.append({
-            "id": str(comment.id),
-            "content": comment.content,
-            "member_id": str(member.id),
-            "member_name": member.business_name,
-            "member_image": member.profile_image_url,
-            "created_at": comment.created_at
-        })
+    # Rows are loaded inside the request session; only the encoding is streamed
+    result = await db.execute(query)
+    comments = [_comment_row(comment, member) for comment, member in result]
+    if not limit:
+        return StreamingResponse(_stream_comments(comments), media_type="application/json")
+    
+    if len(comments) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = _encode_cursor(comments[-1]["created_at"], comments[-1]["id"])
     
     return comments
 
+
+def _comment_row(comment: GEPPostComment, member: GEPMember) -> dict:
+    """Response shape for one comment"""
+    return {
+        "id": comment.id,
+        "content": comment.content,
+        "member_id": member.id,
+        "member_name": member.business_name,
+        "member_image": member.profile_image_url,
+        "created_at": comment.created_at
+    }
+
+
+def _stream_comments(comments: List[dict]):
+    """Yield a JSON array of comments a batch at a time instead of encoding one large body"""
+    separator = b"["
+    for start in range(0, len(comments), COMMENT_STREAM_BATCH_SIZE):
+        batch = comments[start:start + COMMENT_STREAM_BATCH_SIZE]
+        yield separator + b",".join(orjson.dumps(row) for row in batch)
+        separator = b","
+    yield b"]" if separator == b"," else b"[]"
@@ -8,7 +8,9 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
 from datetime import datetime
+import asyncio
 import logging
+import uuid as uuid_lib
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete
 from app.core.database import get_db
@@ -73,7 +75,6 @@ async def initiate_facebook_connection(
     Initiate Facebook OAuth2 connection for the current user
     Returns the authorization URL for the user to visit
     """
-    import asyncio
     try:
         logger.info(f"Facebook connect - Initiating connection for user_id: {current_user_id} (type: {type(current_user_id).__name__})")
         
@@ -159,7 +160,6 @@ async def facebook_oauth_callback(
             
             # Verify that the user_id from state matches the authenticated user_id (if available)
             if authenticated_user_id:
-                import uuid as uuid_lib
                 auth_uuid = authenticated_user_id
                 state_uuid = user_id
                 
@@ -196,7 +196,6 @@ async def facebook_oauth_callback(
             logger.info(f"Facebook callback - Received user_id from state: {user_id} (type: {type(user_id).__name__})")
             
             # Convert user_id to UUID if it's a string
-            import uuid as uuid_lib
             if isinstance(user_id, str):
                 try:
                     user_id = uuid_lib.UUID(user_id)
@@ -334,7 +333,6 @@ async def get_facebook_connection_status(
     """
     try:
         # Convert user_id to UUID if it's a string
-        import uuid as uuid_lib
         if isinstance(current_user_id, str):
             try:
                 current_user_id = uuid_lib.UUID(current_user_id)
@@ -402,7 +400,6 @@ async def disconnect_facebook(
     """
     try:
         # Convert user_id to UUID if it's a string
-        import uuid as uuid_lib
         if isinstance(current_user_id, str):
             try:
                 current_user_id = uuid_lib.UUID(current_user_id)
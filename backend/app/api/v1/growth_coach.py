@@ -13,10 +13,14 @@ from app.models.gep_models import GEPMember, GEPGrowthTask
 from app.utils.auth import get_current_user
 from app.agents.growth_coach_agent import GrowthCoachAgent
 from app.services.funding_readiness_score import FundingReadinessCalculator
+from app.services.cache import cache_get, cache_set, invalidate_member
 from pydantic import BaseModel
 
 router = APIRouter()
 
+# The dashboard polls the funding score; recalculating it runs several queries and a commit
+FUNDING_SCORE_CACHE_TTL = 60
+
 
 class TaskResponse(BaseModel):
     id: str
@@ -49,17 +53,20 @@ async def get_daily_tasks(
     coach = GrowthCoachAgent(db)
     tasks = await coach.generate_daily_tasks(str(member.id))
     
+    # Look up which task types are already open in one query instead of one per task
+    existing = await db.execute(
+        select(GEPGrowthTask.task_type).where(
+            GEPGrowthTask.member_id == member.id,
+            GEPGrowthTask.task_type.in_([task_data["task_type"] for task_data in tasks]),
+            GEPGrowthTask.is_completed == False
+        )
+    )
+    open_task_types = set(existing.scalars())
+    
     # Save tasks to database
     for task_data in tasks:
-        # Check if task already exists
-        existing = await db.execute(
-            select(GEPGrowthTask).where(
-                GEPGrowthTask.member_id == member.id,
-                GEPGrowthTask.task_type == task_data["task_type"],
-                GEPGrowthTask.is_completed == False
-            )
-        )
-        if not existing.scalar_one_or_none():
+        if task_data["task_type"] not in open_task_types:
+            open_task_types.add(task_data["task_type"])
             new_task = GEPGrowthTask(
                 member_id=member.id,
                 **task_data
@@ -150,8 +157,15 @@ async def get_funding_score(
     if not member:
         raise HTTPException(status_code=404, detail="Member profile not found")
     
+    cache_key = f"funding-score:{member.id}"
+    score_data = cache_get(cache_key, ttl_sec=FUNDING_SCORE_CACHE_TTL)
+    if score_data:
+        return score_data
+    
     # Calculate score
-    calculator = FundingReadinessCalculator()
-    score_data = await calculator.calculate_score(str(member.id), db)
+    score_data = await FundingReadinessCalculator.calculate_score(str(member.id), db)
+    await db.commit()
+    invalidate_member(member.id)
+    cache_set(cache_key, score_data, ttl_sec=FUNDING_SCORE_CACHE_TTL)
     
     return score_data
@@ -2,17 +2,78 @@
 Global Empowerment Platform - Member Directory API
 Search and filter members by business type, skills, city, funding score
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_, and_, func
-from typing import List, Optional
+from sqlalchemy import select, or_, and_, func, literal_column, tuple_
+from typing import Any, Dict, List, Optional, Tuple
 from pydantic import BaseModel
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import uuid
 
-from app.core.database import get_db
+from app.core.database import get_db, AsyncSessionLocal
 from app.models.gep_models import GEPMember
 from app.utils.auth import get_current_user
+from app.services.cache import cache_get, cache_set, member_cache_key, recent_member, remember_members
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# Profiles change rarely; funding score recalculation clears the entry
+MEMBER_CACHE_TTL = 300
+# Directory searches repeat across users (e.g. the unfiltered first page); keep them briefly
+MEMBER_SEARCH_CACHE_TTL = 60
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Top performers are the same for every visitor; a background task keeps them precomputed
+TOP_PERFORMERS_CACHE_KEY = "members:top-performers"
+TOP_PERFORMERS_MAX = 50
+TOP_PERFORMERS_REFRESH_INTERVAL = 300
+TOP_PERFORMERS_CACHE_TTL = TOP_PERFORMERS_REFRESH_INTERVAL * 2
+
+# Members without a score page as 0, matching the expression index from migration 012
+FUNDING_SCORE_SORT_KEY = func.coalesce(GEPMember.funding_readiness_score, literal_column("0"))
+
+
+def _encode_cursor(score: Optional[int], member_id: str) -> str:
+    """Encode the (funding_readiness_score, id) position of the last member on a page"""
+    return base64.urlsafe_b64encode(f"{score or 0}|{member_id}".encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[int, uuid.UUID]:
+    """Decode a cursor produced by _encode_cursor"""
+    try:
+        score, member_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return int(score), uuid.UUID(member_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _cacheable_response(request: Request, payload, max_age: int) -> Response:
+    """JSON response with Cache-Control and an ETag; answers a matching If-None-Match with 304"""
+    response = ORJSONResponse(content=payload)
+    etag = f'"{hashlib.sha1(response.body).hexdigest()}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={max_age}, stale-while-revalidate={max_age * 5}"
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return response
+
+
+def _members_page(request: Request, members: List[Dict[str, Any]], limit: int) -> Response:
+    """Cacheable search response carrying the cursor for the next page when this one is full"""
+    response = _cacheable_response(request, members, MEMBER_SEARCH_CACHE_TTL)
+    if len(members) == limit:
+        last = members[-1]
+        response.headers[NEXT_CURSOR_HEADER] = _encode_cursor(last["funding_readiness_score"], last["id"])
+    return response
 
 
 class MemberProfile(BaseModel):
@@ -36,6 +97,7 @@ class MemberProfile(BaseModel):
 
 @router.get("/members", response_model=List[MemberProfile])
 async def search_members(
+    request: Request,
     business_type: Optional[str] = Query(None),
     industry: Optional[str] = Query(None),
     city: Optional[str] = Query(None),
@@ -46,9 +108,18 @@ async def search_members(
     search: Optional[str] = Query(None),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
     db: AsyncSession = Depends(get_db)
 ):
-    """Search members with filters"""
+    """Search members with filters; page with the X-Next-Cursor header (offset is still accepted)"""
+    cache_key = "members:search:" + json.dumps(
+        [business_type, industry, city, state, skill, min_funding_score, max_funding_score, search, limit, offset, cursor],
+        separators=(',', ':')
+    )
+    cached = cache_get(cache_key, ttl_sec=MEMBER_SEARCH_CACHE_TTL)
+    if cached is not None:
+        return _members_page(request, cached, limit)
+    
     query = select(GEPMember)
     
     # Apply filters
@@ -86,14 +157,20 @@ async def search_members(
     if conditions:
         query = query.where(and_(*conditions))
     
-    # Order by funding score (highest first)
-    query = query.order_by(GEPMember.funding_readiness_score.desc())
-    query = query.limit(limit).offset(offset)
+    # Order by funding score (highest first, unscored as 0); id breaks ties so the cursor position is unique
+    query = query.order_by(FUNDING_SCORE_SORT_KEY.desc(), GEPMember.id.desc())
+    if cursor:
+        query = query.where(
+            tuple_(FUNDING_SCORE_SORT_KEY, GEPMember.id) < tuple_(*_decode_cursor(cursor))
+        )
+    else:
+        query = query.offset(offset)
+    query = query.limit(limit)
     
     result = await db.execute(query)
     members = result.scalars().all()
     
-    return [
+    results = [
         {
             "id": str(m.id),
             "business_name": m.business_name,
@@ -111,14 +188,42 @@ async def search_members(
         }
         for m in members
     ]
+    cache_set(cache_key, results, ttl_sec=MEMBER_SEARCH_CACHE_TTL)
+    remember_members(results)
+    
+    return _members_page(request, results, limit)
+
+
+@router.get("/members/top-performers", response_model=List[MemberProfile])
+async def get_top_performers(
+    request: Request,
+    limit: int = Query(10, ge=1, le=TOP_PERFORMERS_MAX),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get top performers by funding readiness score (precomputed by the background refresher)"""
+    top_performers = cache_get(TOP_PERFORMERS_CACHE_KEY, ttl_sec=TOP_PERFORMERS_CACHE_TTL)
+    if top_performers is None:
+        top_performers = await _load_top_performers(db)
+    
+    return _cacheable_response(request, top_performers[:limit], TOP_PERFORMERS_REFRESH_INTERVAL)
 
 
 @router.get("/members/{member_id}", response_model=MemberProfile)
 async def get_member_profile(
     member_id: str,
+    request: Request,
     db: AsyncSession = Depends(get_db)
 ):
     """Get a specific member's profile"""
+    recent = recent_member(member_id, ttl_sec=MEMBER_SEARCH_CACHE_TTL)
+    if recent:
+        return _cacheable_response(request, recent, MEMBER_SEARCH_CACHE_TTL)
+    
+    cache_key = member_cache_key(member_id)
+    cached = cache_get(cache_key, ttl_sec=MEMBER_CACHE_TTL)
+    if cached:
+        return _cacheable_response(request, cached, MEMBER_CACHE_TTL)
+    
     result = await db.execute(
         select(GEPMember).where(GEPMember.id == member_id)
     )
@@ -127,7 +232,7 @@ async def get_member_profile(
     if not member:
         raise HTTPException(status_code=404, detail="Member not found")
     
-    return {
+    profile = {
         "id": str(member.id),
         "business_name": member.business_name,
         "business_type": member.business_type,
@@ -142,24 +247,23 @@ async def get_member_profile(
         "funding_status": member.funding_status,
         "profile_image_url": member.profile_image_url
     }
+    cache_set(cache_key, profile, ttl_sec=MEMBER_CACHE_TTL)
+    
+    return _cacheable_response(request, profile, MEMBER_CACHE_TTL)
 
 
-@router.get("/members/top-performers", response_model=List[MemberProfile])
-async def get_top_performers(
-    limit: int = Query(10, ge=1, le=50),
-    db: AsyncSession = Depends(get_db)
-):
-    """Get top performers by funding readiness score"""
+async def _load_top_performers(db: AsyncSession) -> List[Dict[str, Any]]:
+    """Query the top performers list (up to the endpoint's maximum limit)"""
     result = await db.execute(
         select(GEPMember)
         .where(GEPMember.funding_readiness_score >= 50)
         .order_by(GEPMember.funding_readiness_score.desc())
-        .limit(limit)
+        .limit(TOP_PERFORMERS_MAX)
     )
     
     members = result.scalars().all()
     
-    return [
+    top_performers = [
         {
             "id": str(m.id),
             "business_name": m.business_name,
@@ -177,4 +281,16 @@ async def get_top_performers(
         }
         for m in members
     ]
+    cache_set(TOP_PERFORMERS_CACHE_KEY, top_performers, ttl_sec=TOP_PERFORMERS_CACHE_TTL)
+    return top_performers
+
 
+async def run_top_performers_refresher():
+    """Background task: recompute the top performers list every TOP_PERFORMERS_REFRESH_INTERVAL seconds"""
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                await _load_top_performers(db)
+        except Exception as e:
+            logger.error(f"Failed to refresh top performers: {e}")
+        await asyncio.sleep(TOP_PERFORMERS_REFRESH_INTERVAL)
@@ -13,7 +13,7 @@ import logging
 from app.core.database import get_db
 from app.models.gep_models import Profile, PitchDeck
 from app.utils.auth import get_current_user
-from app.services.pitchdeck_generator import PitchDeckGenerator
+from app.services.pitchdeck_generator import get_pitchdeck_generator
 from pydantic import BaseModel
 
 router = APIRouter()
@@ -69,7 +69,7 @@ async def generate_pitchdeck(
         
         # Generate pitch deck using AI
         logger.info(f"Generating pitch deck for user {user_id}")
-        generator = PitchDeckGenerator()
+        generator = get_pitchdeck_generator()
         
         # Convert Pydantic model to dict
         input_data = deck_data.model_dump()
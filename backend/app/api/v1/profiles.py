@@ -20,6 +20,8 @@ from pydantic import BaseModel
 
 router = APIRouter()
 
+UUID_PATTERN = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$')
+
 
 class ProfileResponse(BaseModel):
     id: str
@@ -245,8 +247,7 @@ async def upsert_profile_onboarding(
         if is_dev_mode:
             # In dev mode, trust the user_id from the request if it's a valid UUID format
             # This allows real Supabase users to update their profiles even though we're using mock auth
-            uuid_pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
-            is_valid_uuid = re.match(uuid_pattern, str(user_id).lower()) is not None
+            is_valid_uuid = UUID_PATTERN.match(str(user_id).lower()) is not None
             if not is_demo_user and is_valid_uuid:
                 logger.info(f"Dev mode: Allowing update for valid UUID user_id: {user_id}")
                 # Skip authorization check in dev mode for valid UUIDs
@@ -11,6 +11,39 @@ from typing import List, Optional
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# (tier, multiplier on the listed price, demo price when none given, description, days to sell)
+PRICE_TIERS = (
+    ("quick_sale", 0.85, 15000, "Fast sale price", 7),
+    ("market_price", 1, 18000, "Competitive market price", 14),
+    ("top_dollar", 1.15, 21000, "Premium pricing", 30),
+)
+
+# Drops thousands separators, currency sign and spaces in one C-level pass
+_PRICE_STRIP_TABLE = str.maketrans("", "", ",$ ")
+
+
+def _parse_price(price: Optional[str]) -> Optional[int]:
+    """Parse a form price like "$15,000" once; None when missing or not numeric"""
+    if not price:
+        return None
+    try:
+        value = int(price.translate(_PRICE_STRIP_TABLE))
+    except ValueError:
+        return None
+    return value if value > 0 else None
+
+
+def _price_recommendations(listed_price: Optional[int]) -> dict:
+    """Build every price tier from PRICE_TIERS with one shared shape"""
+    return {
+        tier: {
+            "price": listed_price * multiplier if listed_price else default_price,
+            "description": description,
+            "estimated_days_to_sell": days_to_sell
+        }
+        for tier, multiplier, default_price, description, days_to_sell in PRICE_TIERS
+    }
+
 
 @router.post("/public-analyze-images")
 async def public_analyze_images(
@@ -30,6 +63,7 @@ async def public_analyze_images(
     """
     try:
         logger.info(f"Public analysis request received for {len(images)} images")
+        listed_price = _parse_price(price)
         
         # Mock successful analysis for demo purposes
         mock_analysis = {
@@ -73,23 +107,7 @@ async def public_analyze_images(
                 }
             },
             "price_recommendations": {
-                "price_recommendations": {
-                    "quick_sale": {
-                        "price": int(price) * 0.85 if price else 15000,
-                        "description": "Fast sale price",
-                        "estimated_days_to_sell": 7
-                    },
-                    "market_price": {
-                        "price": int(price) if price else 18000,
-                        "description": "Competitive market price",
-                        "estimated_days_to_sell": 14
-                    },
-                    "top_dollar": {
-                        "price": int(price) * 1.15 if price else 21000,
-                        "description": "Premium pricing",
-                        "estimated_days_to_sell": 30
-                    }
-                }
+                "price_recommendations": _price_recommendations(listed_price)
             },
             "confidence_score": 0.92,
             "processing_time": 1.2,
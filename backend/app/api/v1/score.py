@@ -13,6 +13,7 @@ from app.core.database import get_db
 from app.models.gep_models import Profile, FundingScoreLog
 from app.utils.auth import get_current_user
 from app.services.funding_readiness_score import FundingReadinessCalculator
+from app.services.cache import invalidate_member
 from pydantic import BaseModel
 
 router = APIRouter()
@@ -54,14 +55,10 @@ async def calculate_funding_score(
         raise HTTPException(status_code=404, detail="Profile not found")
     
     # Calculate score using the service
-    calculator = FundingReadinessCalculator()
-    score_data = await calculator.calculate_score(str(profile.id), db)
+    score_data = await FundingReadinessCalculator.calculate_score(str(profile.id), db)
     
-    # Update profile score
+    # Update profile score and log it in the same transaction
     profile.funding_score = score_data.get("score", 0)
-    await db.commit()
-    
-    # Log the score
     new_log = FundingScoreLog(
         user_id=profile.id,
         score=score_data.get("score", 0),
@@ -70,6 +67,7 @@ async def calculate_funding_score(
     
     db.add(new_log)
     await db.commit()
+    invalidate_member(profile.id)
     await db.refresh(new_log)
     
     return {
@@ -1,39 +1,58 @@
-from fastapi import APIRouter, Request, Depends, status
+from fastapi import APIRouter, status
 from fastapi.responses import JSONResponse
-from sqlalchemy.ext.asyncio import AsyncSession
-from datetime import datetime
+from pydantic import BaseModel, Field
+from typing import Any, Optional, Union
+from datetime import datetime, timezone
+import json
 
-from ...core.database import get_db
-from ...models import Event
+from ...services.data_collection_service import data_collection_service
 
 router = APIRouter(prefix="/user", tags=["user"])
 
-@router.post("/log_action", status_code=status.HTTP_201_CREATED)
-async def log_action(request: Request, db: AsyncSession = Depends(get_db)):
-    data = await request.json()
-    event_type = data.get("action")
-    event_detail = data.get("detail", "")
-    user_id = data.get("user_id")  # Optional, for future use
-    session_id = data.get("session_id")  # Optional, for future use
-    timestamp = data.get("timestamp", datetime.utcnow().isoformat())
-    platform = data.get("platform", "web")
-    page = data.get("page", "dashboard")
-    element = data.get("element", "clear_button")
-    referrer = data.get("referrer", "")
-
-    event = Event(
-        event_type=event_type,
-        event_detail=event_detail,
-        user_id=user_id,
-        session_id=session_id,
-        car_id=None,
-        timestamp=timestamp,
-        platform=platform,
-        page=page,
-        element=element,
-        referrer=referrer,
-    )
-    db.add(event)
-    await db.commit()
-    await db.refresh(event)
-    return JSONResponse(status_code=201, content={"message": "Action logged", "event_id": event.event_id}) 
\ No newline at end of file
+
+class LogActionRequest(BaseModel):
+    action: str = Field(..., min_length=1)
+    detail: Any = ""
+    user_id: Optional[Union[str, int]] = None
+    session_id: Optional[str] = None
+    timestamp: Optional[str] = None
+    platform: Optional[str] = "web"
+    page: Optional[str] = "dashboard"
+    element: Optional[str] = "clear_button"
+    referrer: Optional[str] = ""
+
+
+def _parse_timestamp(timestamp: Optional[str]) -> datetime:
+    """Naive UTC datetime for an ISO 8601 client timestamp, or now when it is missing or malformed"""
+    try:
+        parsed = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return datetime.utcnow()
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+@router.post("/log_action", status_code=status.HTTP_202_ACCEPTED)
+async def log_action(payload: LogActionRequest):
+    event_detail = payload.detail
+    if not isinstance(event_detail, str):
+        event_detail = json.dumps(event_detail, default=str)
+
+    # Written in batches by the data collection service's event writer; over-long
+    # strings are truncated to their column there
+    queued = data_collection_service.enqueue_event({
+        "event_type": payload.action,
+        "event_detail": event_detail,
+        "user_id": str(payload.user_id) if payload.user_id is not None else None,
+        "session_id": payload.session_id,
+        "car_id": None,
+        "timestamp": _parse_timestamp(payload.timestamp),
+        "platform": payload.platform,
+        "page": payload.page,
+        "element": payload.element,
+        "referrer": payload.referrer,
+    })
+    if not queued:
+        return JSONResponse(status_code=503, content={"message": "Event queue is full, try again later"})
+    return JSONResponse(status_code=202, content={"message": "Action queued"})
\ No newline at end of file
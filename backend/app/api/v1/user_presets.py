@@ -6,11 +6,29 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel
 from typing import List, Optional
 from datetime import datetime
+import logging
 import re
 
 from app.core.supabase_config import get_supabase
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# Common damage/repair phrases to extract
+DAMAGE_PATTERNS = [
+    r'front\s+bumper\s+(cover|replace|replaced|damage)',
+    r'rear\s+bumper\s+(cover|replace|replaced|damage)',
+    r'fender\s+(replace|replaced|damage)',
+    r'hood\s+(replace|replaced|damage)',
+    r'door\s+(replace|replaced|damage)',
+    r'windshield\s+(replace|replaced|crack)',
+    r'headlight\s+(replace|replaced|damage)',
+    r'taillight\s+(replace|replaced|damage)',
+    r'quarter\s+panel\s+(replace|replaced|damage)',
+    r'frame\s+(damage|repair)',
+]
+# All patterns fused into one alternation so the text is scanned once, not once per pattern
+DAMAGE_PHRASE_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in DAMAGE_PATTERNS))
 
 
 class PresetCreate(BaseModel):
@@ -55,7 +73,7 @@ async def get_user_presets(
         return result.data if result.data else []
         
     except Exception as e:
-        print(f"[USER-PRESETS] Error getting presets: {e}")
+        logger.error("[USER-PRESETS] Error getting presets: %s", e)
         return []
 
 
@@ -101,7 +119,7 @@ async def create_or_update_preset(
             return new_preset.data[0] if new_preset.data else None
             
     except Exception as e:
-        print(f"[USER-PRESETS] Error creating preset: {e}")
+        logger.error("[USER-PRESETS] Error creating preset: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to save preset: {str(e)}")
 
 
@@ -124,69 +142,63 @@ async def extract_and_save_presets(
         supabase = get_supabase()
         saved_count = 0
         
-        # Common damage/repair phrases to extract
-        damage_patterns = [
-            r'front\s+bumper\s+(cover|replace|replaced|damage)',
-            r'rear\s+bumper\s+(cover|replace|replaced|damage)',
-            r'fender\s+(replace|replaced|damage)',
-            r'hood\s+(replace|replaced|damage)',
-            r'door\s+(replace|replaced|damage)',
-            r'windshield\s+(replace|replaced|crack)',
-            r'headlight\s+(replace|replaced|damage)',
-            r'taillight\s+(replace|replaced|damage)',
-            r'quarter\s+panel\s+(replace|replaced|damage)',
-            r'frame\s+(damage|repair)',
-        ]
-        
         # Extract phrases
         extracted_phrases = []
+        seen_phrases = set()
         about_lower = about_vehicle.lower()
         
-        for pattern in damage_patterns:
-            matches = re.findall(pattern, about_lower, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    phrase = ' '.join(match)
-                else:
-                    phrase = match
-                if phrase and phrase not in extracted_phrases:
-                    extracted_phrases.append(phrase)
+        for match in DAMAGE_PHRASE_RE.finditer(about_lower):
+            # Each pattern has one group; lastindex is the one that matched
+            phrase = match.group(match.lastindex)
+            if phrase and phrase not in seen_phrases:
+                seen_phrases.add(phrase)
+                extracted_phrases.append(phrase)
         
         # Also save title status if provided
         if title_status and title_status.lower() != 'clean':
             extracted_phrases.append(title_status.lower())
         
-        # Save each extracted phrase
+        # Look up every extracted phrase in one query instead of one per phrase
+        existing_by_value = {}
+        if extracted_phrases:
+            existing = supabase.table("user_presets").select("*").eq(
+                "user_id", user_id
+            ).eq("preset_type", "description_phrase").in_(
+                "preset_value", extracted_phrases
+            ).execute()
+            existing_by_value = {row["preset_value"]: row for row in existing.data or []}
+        
+        now = datetime.utcnow().isoformat()
+        new_presets = []
         for phrase in extracted_phrases:
+            row = existing_by_value.get(phrase)
+            if not row:
+                new_presets.append({
+                    "user_id": user_id,
+                    "preset_type": "description_phrase",
+                    "preset_value": phrase,
+                    "usage_count": 1,
+                    "last_used_at": now
+                })
+                continue
             try:
-                # Check if exists
-                existing = supabase.table("user_presets").select("*").eq(
-                    "user_id", user_id
-                ).eq("preset_type", "description_phrase").eq(
-                    "preset_value", phrase
-                ).execute()
-                
-                if existing.data and len(existing.data) > 0:
-                    # Increment usage
-                    supabase.table("user_presets").update({
-                        "usage_count": existing.data[0]["usage_count"] + 1,
-                        "last_used_at": datetime.utcnow().isoformat(),
-                        "updated_at": datetime.utcnow().isoformat()
-                    }).eq("id", existing.data[0]["id"]).execute()
-                else:
-                    # Create new
-                    supabase.table("user_presets").insert({
-                        "user_id": user_id,
-                        "preset_type": "description_phrase",
-                        "preset_value": phrase,
-                        "usage_count": 1,
-                        "last_used_at": datetime.utcnow().isoformat()
-                    }).execute()
-                
+                # Increment usage
+                supabase.table("user_presets").update({
+                    "usage_count": row["usage_count"] + 1,
+                    "last_used_at": now,
+                    "updated_at": now
+                }).eq("id", row["id"]).execute()
                 saved_count += 1
             except Exception as e:
-                print(f"[USER-PRESETS] Error saving phrase '{phrase}': {e}")
-                continue
+                logger.warning("[USER-PRESETS] Error saving phrase '%s': %s", phrase, e)
+        
+        # Create all new phrases in a single insert
+        if new_presets:
+            try:
+                supabase.table("user_presets").insert(new_presets).execute()
+                saved_count += len(new_presets)
+            except Exception as e:
+                logger.warning("[USER-PRESETS] Error saving %d new phrases: %s", len(new_presets), e)
         
         return {
             "saved": saved_count,
@@ -195,7 +207,7 @@ async def extract_and_save_presets(
         }
         
     except Exception as e:
-        print(f"[USER-PRESETS] Error extracting presets: {e}")
+        logger.error("[USER-PRESETS] Error extracting presets: %s", e)
         return {"saved": 0, "error": str(e)}
 
 
@@ -228,6 +240,6 @@ async def delete_preset(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[USER-PRESETS] Error deleting preset: {e}")
+        logger.error("[USER-PRESETS] Error deleting preset: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to delete preset: {str(e)}")
 
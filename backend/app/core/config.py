@@ -19,6 +19,15 @@ class Settings(BaseSettings):
     # Database (fallback for local development)
     DATABASE_URL: str = "sqlite:///./gep.db"
     
+    # Database connection pool (PostgreSQL only)
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE: int = 3600
+    DB_POOL_TIMEOUT: int = 30
+    # asyncpg prepared statements cached per connection; set to 0 behind a
+    # transaction-mode pooler (e.g. pgbouncer) that cannot keep them
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 500
+    
     # Redis (optional for caching)
     REDIS_URL: str = ""
     
@@ -1,7 +1,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from app.core.config import settings
 import logging
 
@@ -30,27 +30,37 @@ if settings.DATABASE_URL.startswith("sqlite"):
         os.makedirs(db_dir, exist_ok=True)
     
     async_database_url = f"sqlite+aiosqlite:///{db_path}"
-    sync_database_url = f"sqlite:///{db_path}"
     logger.info(f"Using SQLite database at: {db_path}")
+    
+    # SQLite uses the driver's default pool
+    pool_options = {
+        "pool_pre_ping": True,
+        "pool_recycle": 300
+    }
 else:
     # Use asyncpg for PostgreSQL
-    async_database_url = settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
-    sync_database_url = settings.DATABASE_URL
+    async_database_url = make_url(
+        settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
+    ).update_query_dict({
+        # Hot queries skip parse/plan and go straight to bind + execute
+        "prepared_statement_cache_size": str(settings.DB_PREPARED_STATEMENT_CACHE_SIZE)
+    })
+    
+    # Size the pool for concurrent requests; each request holds a connection
+    # for the whole Depends(get_db) scope (override via DB_POOL_SIZE / DB_MAX_OVERFLOW)
+    pool_options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_pre_ping": True
+    }
 
 # Async engine
 async_engine = create_async_engine(
     async_database_url,
     echo=settings.DEBUG,
-    pool_pre_ping=True,
-    pool_recycle=300
-)
-
-# Sync engine
-sync_engine = create_engine(
-    sync_database_url,
-    echo=settings.DEBUG,
-    pool_pre_ping=True,
-    pool_recycle=300
+    **pool_options
 )
 
 # Create async session factory
@@ -60,16 +70,6 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False
 )
 
-# Create sync session factory (with error handling)
-try:
-    SessionLocal = sessionmaker(
-        bind=sync_engine,
-        expire_on_commit=False
-    )
-except Exception as e:
-    logger.warning(f"Failed to create database session factory: {e}. App will run without database.")
-    SessionLocal = None
-
 # Create base class for models
 Base = declarative_base()
 
@@ -81,40 +81,26 @@ async def get_db() -> AsyncSession:
             yield session
         except Exception as e:
             logger.error(f"Database session error: {e}")
+            if isinstance(e, PoolTimeoutError):
+                # Pool internals stay in the logs, not on the public /health response
+                logger.error(f"Database pool exhausted: {get_pool_status()}")
             await session.rollback()
             raise
         finally:
             await session.close()
 
 
-def get_sync_db():
-    """Dependency to get synchronous database session"""
-    if SessionLocal is None:
-        # Database not configured - yield None so endpoint can still work
-        yield None
-        return
-    
-    db = None
-    try:
-        db = SessionLocal()
-        yield db
-    except Exception as e:
-        error_msg = str(e) if str(e) else f"Database error: {type(e).__name__}"
-        logger.warning(f"Database session error (non-fatal): {error_msg}")
-        # Don't fail if database isn't configured - allow app to run without DB
-        if db:
-            try:
-                db.rollback()
-            except:
-                pass
-        # Yield None instead of raising - endpoint can work without DB
-        yield None
-    finally:
-        if db:
-            try:
-                db.close()
-            except:
-                pass
+def get_pool_status() -> dict:
+    """Report async pool usage; logged by get_db when a checkout times out"""
+    pool = async_engine.pool
+    status = {"pool_class": type(pool).__name__}
+    if hasattr(pool, "checkedout"):
+        status.update({
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow()
+        })
+    return status
 
 
 async def init_db():
@@ -131,5 +117,4 @@ async def init_db():
 async def close_db():
     """Close database connections"""
     await async_engine.dispose()
-    sync_engine.dispose()
     logger.info("Database connections closed") 
\ No newline at end of file
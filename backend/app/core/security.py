@@ -4,6 +4,7 @@ GEP Backend Security Configuration
 """
 
 import os
+import re
 import secrets
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
@@ -268,6 +269,10 @@ class SecurityAudit:
         }
         SecurityAudit.log_security_event("api_access", user_id, details)
 
+# Input validation patterns, compiled once
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+PHONE_PATTERN = re.compile(r'^\+?1?\d{9,15}$')
+
 class InputValidation:
     """Secure Input Validation"""
     
@@ -287,16 +292,12 @@ class InputValidation:
     @staticmethod
     def validate_email(email: str) -> bool:
         """Validate email format"""
-        import re
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+        return bool(EMAIL_PATTERN.match(email))
     
     @staticmethod
     def validate_phone(phone: str) -> bool:
         """Validate phone number format"""
-        import re
-        pattern = r'^\+?1?\d{9,15}$'
-        return bool(re.match(pattern, phone))
+        return bool(PHONE_PATTERN.match(phone))
 
 # Security middleware dependencies
 security = HTTPBearer()
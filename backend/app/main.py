@@ -9,14 +9,16 @@ from fastapi import FastAPI, Request, Response, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 import logging
 import asyncio
+import re
 import time
 from datetime import datetime
+from itertools import chain
 
 from app.core.config import settings
 from app.core.database import async_engine, Base
@@ -34,6 +36,8 @@ try:
 except ImportError:
     test_apis_router = None
 from app.middleware import rate_limit_middleware, cleanup_rate_limits
+from app.services.data_collection_service import data_collection_service
+from app.services.http_session import close_http_session
 from app.core.security import (
     SecurityConfig, 
     AuthenticationManager, 
@@ -55,26 +59,41 @@ limiter = Limiter(key_func=get_remote_address)
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
     # Startup
-    print("🚀 Starting Global Empowerment Platform (GEP)...")
+    logger.info("Starting Global Empowerment Platform (GEP)...")
     
     # Start rate limit cleanup task
     cleanup_task = asyncio.create_task(cleanup_rate_limits())
     
+    # Start batched analytics event writer
+    event_writer_task = asyncio.create_task(data_collection_service.run_event_writer())
+    
+    # Keep the member directory's top performers list precomputed
+    top_performers_task = asyncio.create_task(member_directory.run_top_performers_refresher())
+    
     yield
     
     # Shutdown
-    print("🛑 Shutting down Global Empowerment Platform (GEP)...")
-    cleanup_task.cancel()
-    try:
-        await cleanup_task
-    except asyncio.CancelledError:
-        pass
+    logger.info("Shutting down Global Empowerment Platform (GEP)...")
+    for task in (cleanup_task, event_writer_task, top_performers_task):
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    
+    # Write any events still queued
+    await data_collection_service.flush_events()
+    
+    # Release pooled outbound connections
+    await close_http_session()
 
 app = FastAPI(
     title="Global Empowerment Platform (GEP) API",
     description="Social growth engine for entrepreneurs - AI coaching, community, and funding readiness",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson encodes response bodies in C instead of the stdlib json module
+    default_response_class=ORJSONResponse
 )
 
 # Add rate limiting exception handler
@@ -84,26 +103,28 @@ app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 # CORS middleware - MUST be first to handle preflight requests
 # Ensure localhost:3000 is always included and all GEP domains
 # Note: FastAPI CORS doesn't support wildcards, so we need to allow all Vercel preview domains
-cors_origins = list(set(settings.ALLOWED_ORIGINS + [
+# dict.fromkeys dedupes while keeping configured origins first in a stable order
+cors_origins = list(dict.fromkeys(chain(settings.ALLOWED_ORIGINS, [
     "http://localhost:3000", 
     "http://127.0.0.1:3000",
     "https://www.globalempowerment.com",
     "https://globalempowerment.com",
     "https://gep.vercel.app",
     "https://global-empowerment-platform.vercel.app"
-]))
+])))
 
 # Add all Vercel preview domains (they follow pattern: global-empowerment-platform-*.vercel.app)
 # Since FastAPI doesn't support wildcards, we'll handle this in the middleware
+VERCEL_PREVIEW_ORIGIN = re.compile(r"https://global-empowerment-platform-.*\.vercel\.app")
 logger.info(f"CORS origins configured: {cors_origins}")
 app.add_middleware(
     CORSMiddleware,
     allow_origins=cors_origins,
-    allow_origin_regex=r"https://global-empowerment-platform-.*\.vercel\.app",
+    allow_origin_regex=VERCEL_PREVIEW_ORIGIN.pattern,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
     allow_headers=["*"],
-    expose_headers=["X-Total-Count", "X-Rate-Limit-Remaining"]
+    expose_headers=["X-Total-Count", "X-Rate-Limit-Remaining", "X-Next-Cursor"]
 )
 
 # Security middleware stack (after CORS)
@@ -143,8 +164,6 @@ async def health_check():
 @app.middleware("http")
 async def add_security_headers(request: Request, call_next):
     """Add comprehensive security headers to all responses"""
-    import re
-    
     # Handle OPTIONS preflight requests explicitly
     if request.method == "OPTIONS":
         origin = request.headers.get("origin")
@@ -153,7 +172,7 @@ async def add_security_headers(request: Request, call_next):
         if origin:
             if origin in cors_origins:
                 is_allowed = True
-            elif re.match(r"https://global-empowerment-platform-.*\.vercel\.app", origin):
+            elif VERCEL_PREVIEW_ORIGIN.match(origin):
                 is_allowed = True
         
         if is_allowed:
@@ -173,7 +192,7 @@ async def add_security_headers(request: Request, call_next):
     except Exception as e:
         # If an exception occurs, create a response with CORS headers
         logger.error(f"Exception in middleware: {e}")
-        response = JSONResponse(
+        response = ORJSONResponse(
             status_code=500,
             content={"error": "Internal server error", "message": "Something went wrong"}
         )
@@ -181,7 +200,7 @@ async def add_security_headers(request: Request, call_next):
     # Ensure CORS headers are always present for allowed origins
     origin = request.headers.get("origin")
     if origin:
-        is_allowed = origin in cors_origins or re.match(r"https://global-empowerment-platform-.*\.vercel\.app", origin)
+        is_allowed = origin in cors_origins or VERCEL_PREVIEW_ORIGIN.match(origin)
         if is_allowed:
             if "Access-Control-Allow-Origin" not in response.headers:
                 response.headers["Access-Control-Allow-Origin"] = origin
@@ -190,8 +209,7 @@ async def add_security_headers(request: Request, call_next):
     
     # Add all security headers from configuration
     try:
-        from app.core.security import SECURITY_HEADERS as headers
-        for header, value in headers.items():
+        for header, value in SECURITY_HEADERS.items():
             if header not in response.headers:  # Don't override existing headers
                 response.headers[header] = value
     except Exception as e:
@@ -341,7 +359,7 @@ async def root():
 async def http_exception_handler(request: Request, exc: HTTPException):
     """HTTP exception handler with CORS headers"""
     logger.error(f"HTTP exception: {exc.status_code} - {exc.detail}")
-    response = JSONResponse(
+    response = ORJSONResponse(
         status_code=exc.status_code,
         content={"error": exc.detail}
     )
@@ -356,7 +374,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler with CORS headers"""
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    response = JSONResponse(
+    response = ORJSONResponse(
         status_code=500,
         content={"error": "Internal server error", "message": "Something went wrong"}
     )
@@ -1,7 +1,7 @@
 """
 Global Empowerment Platform (GEP) Database Models
 """
-from sqlalchemy import Column, String, Integer, Boolean, Text, DateTime, ForeignKey, DECIMAL, ARRAY, JSON, CheckConstraint, UniqueConstraint
+from sqlalchemy import Column, String, Integer, Boolean, Text, DateTime, ForeignKey, DECIMAL, ARRAY, JSON, CheckConstraint, UniqueConstraint, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -46,6 +46,7 @@ class GEPMember(Base):
     __table_args__ = (
         CheckConstraint('funding_readiness_score >= 0 AND funding_readiness_score <= 100', name='check_funding_score_range'),
         CheckConstraint("funding_status IN ('Building', 'Emerging', 'VC-Ready')", name='check_funding_status'),
+        Index('idx_gep_members_funding_score_id', text('COALESCE(funding_readiness_score, 0) DESC'), text('id DESC')),
     )
 
 
@@ -85,6 +86,9 @@ class GEPPost(Base):
     
     __table_args__ = (
         CheckConstraint("post_type IN ('text', 'image', 'video', 'carousel')", name='check_post_type'),
+        Index('idx_gep_posts_published_created_at', text('created_at DESC'), text('id DESC'), postgresql_where=text('is_published')),
+        Index('idx_gep_posts_hashtags', 'hashtags', postgresql_using='gin'),
+        Index('idx_gep_posts_mentions', 'mentions', postgresql_using='gin'),
     )
 
 
@@ -120,6 +124,10 @@ class GEPPostComment(Base):
     
     # Relationships
     post = relationship("GEPPost", back_populates="comments")
+    
+    __table_args__ = (
+        Index('idx_gep_post_comments_post_created_at', 'post_id', 'created_at', 'id'),
+    )
 
 
 class GEPProduct(Base):
@@ -277,6 +285,7 @@ class Profile(Base):
     funding_score_logs = relationship("FundingScoreLog", back_populates="user", cascade="all, delete-orphan")
     persona_clones = relationship("PersonaClone", back_populates="user", cascade="all, delete-orphan")
     pitchdecks = relationship("PitchDeck", back_populates="user", cascade="all, delete-orphan")
+    platform_connections = relationship("UserPlatformConnection", back_populates="user", cascade="all, delete-orphan")
     
     __table_args__ = (
         CheckConstraint('funding_score >= 0 AND funding_score <= 100', name='check_funding_score_range'),
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Index
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
 
@@ -33,11 +33,15 @@ class Event(Base):
     event_id = Column(Integer, primary_key=True, autoincrement=True)
     event_type = Column(String(100))
     event_detail = Column(Text)
-    user_id = Column(Integer, nullable=True)
+    user_id = Column(String(255), nullable=True)
     session_id = Column(String(255), nullable=True)
     car_id = Column(Integer, nullable=True)
     timestamp = Column(DateTime, default=datetime.utcnow)
     platform = Column(String(50))
     page = Column(String(255))
     element = Column(String(255))
-    referrer = Column(Text, nullable=True) 
\ No newline at end of file
+    referrer = Column(Text, nullable=True)
+    
+    __table_args__ = (
+        Index('idx_events_user_id_timestamp', 'user_id', 'timestamp'),
+    ) 
\ No newline at end of file
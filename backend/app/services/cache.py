@@ -7,8 +7,13 @@ Uses Redis if available, otherwise falls back to in-memory cache.
 
 import time
 import json
+import logging
 import os
-from typing import Any, Dict, Tuple, Optional
+import orjson
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple, Optional
+
+logger = logging.getLogger(__name__)
 
 # Try to use Redis if available, otherwise use in-memory cache
 _USE_REDIS = False
@@ -30,11 +35,11 @@ try:
     # Test connection
     _redis_client.ping()
     _USE_REDIS = True
-    print("[CACHE] ✅ Using Redis for caching")
+    logger.info("[CACHE] Using Redis for caching")
 except Exception as e:
     _USE_REDIS = False
     _redis_client = None
-    print(f"[CACHE] ⚠️  Redis not available, using in-memory cache: {e}")
+    logger.warning("[CACHE] Redis not available, using in-memory cache: %s", e)
 
 # In-memory cache: key -> (timestamp, value) (fallback)
 _CACHE: Dict[str, Tuple[float, Any]] = {}
@@ -55,10 +60,10 @@ def cache_get(key: str, ttl_sec: int = 900) -> Optional[Any]:
         try:
             cached = _redis_client.get(key)
             if cached:
-                return json.loads(cached)
+                return orjson.loads(cached)
             return None
         except Exception as e:
-            print(f"[CACHE] ⚠️  Redis get failed, falling back to memory: {e}")
+            logger.warning("[CACHE] Redis get failed, falling back to memory: %s", e)
             # Fall through to in-memory cache
     
     # In-memory cache fallback
@@ -89,7 +94,7 @@ def cache_set(key: str, value: Any, ttl_sec: int = 900) -> None:
             _redis_client.setex(key, ttl_sec, json.dumps(value))
             return
         except Exception as e:
-            print(f"[CACHE] ⚠️  Redis set failed, falling back to memory: {e}")
+            logger.warning("[CACHE] Redis set failed, falling back to memory: %s", e)
             # Fall through to in-memory cache
     
     # In-memory cache fallback
@@ -111,7 +116,7 @@ def cache_clear(key: Optional[str] = None) -> None:
                 _redis_client.flushdb()
             return
         except Exception as e:
-            print(f"[CACHE] ⚠️  Redis clear failed, falling back to memory: {e}")
+            logger.warning("[CACHE] Redis clear failed, falling back to memory: %s", e)
             # Fall through to in-memory cache
     
     # In-memory cache fallback
@@ -127,13 +132,53 @@ def cache_size() -> int:
         try:
             return _redis_client.dbsize()
         except Exception as e:
-            print(f"[CACHE] ⚠️  Redis size check failed, falling back to memory: {e}")
+            logger.warning("[CACHE] Redis size check failed, falling back to memory: %s", e)
             # Fall through to in-memory cache
     
     # In-memory cache fallback
     return len(_CACHE)
 
 
+def member_cache_key(member_id: Any) -> str:
+    """Cache key for a member directory profile."""
+    return f"member:{member_id}"
+
+
+# Members recently returned by a directory search, so opening one from the results
+# skips the lookup. Kept per process; invalidate_member evicts from it as well.
+RECENT_MEMBERS_MAX = 1000
+_RECENT_MEMBERS: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+
+def remember_members(members: List[Dict[str, Any]]) -> None:
+    """Record freshly loaded members in the recent-members LRU, evicting the least recently used."""
+    now = time.time()
+    for member in members:
+        _RECENT_MEMBERS[member["id"]] = (now, member)
+        _RECENT_MEMBERS.move_to_end(member["id"])
+    while len(_RECENT_MEMBERS) > RECENT_MEMBERS_MAX:
+        _RECENT_MEMBERS.popitem(last=False)
+
+
+def recent_member(member_id: Any, ttl_sec: int) -> Optional[Dict[str, Any]]:
+    """Get a member recorded by remember_members within ttl_sec, or None."""
+    item = _RECENT_MEMBERS.get(str(member_id))
+    if item is None:
+        return None
+    timestamp, member = item
+    if time.time() - timestamp > ttl_sec:
+        _RECENT_MEMBERS.pop(str(member_id), None)
+        return None
+    _RECENT_MEMBERS.move_to_end(str(member_id))
+    return member
+
+
+def invalidate_member(member_id: Any) -> None:
+    """Drop a member's cached profile and its recent-members entry after it changes."""
+    cache_clear(member_cache_key(member_id))
+    _RECENT_MEMBERS.pop(str(member_id), None)
+
+
 def _normalize_key(payload: Dict[str, Any]) -> str:
     """
     Create a stable cache key from a payload dict.
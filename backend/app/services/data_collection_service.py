@@ -13,6 +13,11 @@ from enum import Enum
 import hashlib
 import uuid
 
+from sqlalchemy import insert, select, func, case, String
+
+from app.core.database import AsyncSessionLocal
+from app.models.user import Event
+
 logger = logging.getLogger(__name__)
 
 class DataCategory(Enum):
@@ -42,6 +47,19 @@ class EventType(Enum):
     CROSS_POST_SUCCESS = "cross_post_success"
     CROSS_POST_FAILED = "cross_post_failed"
 
+# Value -> member lookup, so callers resolve free-form strings without Enum.__call__ raising
+EVENT_TYPES_BY_VALUE: Dict[str, EventType] = {event_type.value: event_type for event_type in EventType}
+
+# Rows waiting for the batch writer; beyond this new events are dropped instead of growing memory
+EVENT_QUEUE_MAXSIZE = 10000
+
+# events text columns -> max length (None for TEXT), taken from the model so rows always fit
+EVENT_STRING_COLUMNS: Dict[str, Optional[int]] = {
+    column.name: column.type.length
+    for column in Event.__table__.columns
+    if isinstance(column.type, String)
+}
+
 @dataclass
 class UserSession:
     """User session data (like Google Analytics)"""
@@ -91,10 +109,12 @@ class DataCollectionService:
     
     def __init__(self):
         self.active_sessions: Dict[str, UserSession] = {}
-        self.event_buffer: List[EventData] = []
+        self.event_queue: asyncio.Queue = asyncio.Queue(maxsize=EVENT_QUEUE_MAXSIZE)
+        self.dropped_events = 0
         self.market_signals: List[MarketSignal] = []
         self.buffer_size = 100
-        self.flush_interval = 60  # seconds
+        self.event_batch_size = 500
+        self.flush_interval = 0.1  # seconds between event batch writes
         
     async def start_session(self, user_id: Optional[str] = None, referrer: Optional[str] = None) -> str:
         """Start a new user session (Google Analytics style)"""
@@ -156,12 +176,8 @@ class DataCollectionService:
             metadata=metadata or {}
         )
         
-        # Add to buffer
-        self.event_buffer.append(event)
-        
-        # Flush if buffer is full
-        if len(self.event_buffer) >= self.buffer_size:
-            await self.flush_events()
+        # Queue for the batch writer
+        self.enqueue_event(self._event_row(event))
         
         logger.debug(f"📊 Event tracked: {event_type.value}")
         return event_id
@@ -443,21 +459,119 @@ class DataCollectionService:
             source="conversion_funnel"
         )
     
-    async def flush_events(self):
-        """Flush events to database (batch processing)"""
-        if not self.event_buffer:
-            return
+    def enqueue_event(self, row: Dict[str, Any]) -> bool:
+        """Queue an events-table row for the batch writer (never blocks the request).
         
-        events_to_flush = self.event_buffer.copy()
-        self.event_buffer.clear()
+        Text fields are coerced to str and truncated to their column length so one
+        malformed row can't fail the whole batch. Returns False when the queue is full
+        and the event was shed.
+        """
+        try:
+            self.event_queue.put_nowait(self._normalize_event_row(row))
+            return True
+        except asyncio.QueueFull:
+            self.dropped_events += 1
+            logger.warning(f"Event queue full, dropped event ({self.dropped_events} dropped so far)")
+            return False
+    
+    @staticmethod
+    def _normalize_event_row(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Coerce an events row to the column types: strings fit their VARCHAR, car_id is int, timestamp is a datetime"""
+        normalized = {}
+        for name, value in row.items():
+            if name in EVENT_STRING_COLUMNS:
+                if value is not None:
+                    value = value if isinstance(value, str) else json.dumps(value, default=str)
+                    max_length = EVENT_STRING_COLUMNS[name]
+                    if max_length is not None:
+                        value = value[:max_length]
+            elif name == "car_id":
+                value = value if isinstance(value, int) and not isinstance(value, bool) else None
+            elif name == "timestamp":
+                value = value if isinstance(value, datetime) else datetime.utcnow()
+            else:
+                continue  # not an events column
+            normalized[name] = value
+        return normalized
+    
+    def _event_row(self, event: EventData) -> Dict[str, Any]:
+        """Map a tracked event onto the events table columns"""
+        return {
+            "event_type": event.event_type.value,
+            "event_detail": json.dumps({
+                "event_id": event.event_id,
+                "user_id": event.user_id,
+                "properties": event.properties,
+                "metadata": event.metadata
+            }, default=str),
+            "user_id": event.user_id,
+            "session_id": event.session_id,
+            "timestamp": event.timestamp,
+            "platform": event.metadata.get("platform", "web"),
+            "page": event.properties.get("page")
+        }
+    
+    def _drain_queue(self, max_items: int) -> List[Dict[str, Any]]:
+        """Pull up to max_items rows that are already queued"""
+        rows = []
+        while len(rows) < max_items:
+            try:
+                rows.append(self.event_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return rows
+    
+    async def _write_events(self, rows: List[Dict[str, Any]]):
+        """Insert a batch of events in a single executemany round-trip.
         
-        # In a real implementation, you'd save to database
-        # For now, we'll log the batch
-        logger.info(f"📊 Flushing {len(events_to_flush)} events to database")
+        If the batch fails, rows are retried one at a time so only the bad row is lost.
+        """
+        if not rows:
+            return
+        try:
+            async with AsyncSessionLocal() as session:
+                await session.execute(insert(Event), rows)
+                await session.commit()
+            logger.debug(f"📊 Wrote {len(rows)} events to database")
+            return
+        except Exception as e:
+            if len(rows) == 1:
+                logger.error(f"Failed to write event, dropping it: {e}")
+                return
+            logger.warning(f"Failed to write batch of {len(rows)} events, retrying individually: {e}")
         
-        for event in events_to_flush:
-            # Save to analytics_events table
-            logger.debug(f"Event: {event.event_type.value} - User: {event.user_id} - Session: {event.session_id}")
+        failed = 0
+        for row in rows:
+            try:
+                async with AsyncSessionLocal() as session:
+                    await session.execute(insert(Event), [row])
+                    await session.commit()
+            except Exception as e:
+                failed += 1
+                logger.error(f"Failed to write event {row.get('event_type')!r}, dropping it: {e}")
+        if failed:
+            logger.error(f"Dropped {failed} of {len(rows)} events after individual retry")
+    
+    async def run_event_writer(self):
+        """Background task: write queued events every flush_interval or event_batch_size rows"""
+        while True:
+            # Wait for the first event, then give the batch flush_interval to fill up
+            first = await self.event_queue.get()
+            try:
+                await asyncio.sleep(self.flush_interval)
+            except asyncio.CancelledError:
+                # Leave it queued for flush_events on shutdown
+                self.enqueue_event(first)
+                raise
+            rows = [first] + self._drain_queue(self.event_batch_size - 1)
+            await self._write_events(rows)
+    
+    async def flush_events(self):
+        """Flush all queued events to database (batch processing, used on shutdown)"""
+        while not self.event_queue.empty():
+            rows = self._drain_queue(self.event_batch_size)
+            logger.info(f"📊 Flushing {len(rows)} events to database")
+            await self._write_events(rows)
     
     async def flush_market_signals(self):
         """Flush market signals to database"""
@@ -474,9 +588,8 @@ class DataCollectionService:
             logger.debug(f"Market Signal: {signal.signal_type} - {signal.asset_type} - {signal.region} - {signal.value}")
     
     async def get_user_analytics(self, user_id: str, days: int = 30) -> Dict[str, Any]:
-        """Get user analytics (Mixpanel style)"""
-        # In a real implementation, query the database
-        return {
+        """Get user analytics (Mixpanel style), aggregated in one query"""
+        analytics = {
             "user_id": user_id,
             "period_days": days,
             "total_events": 0,
@@ -486,6 +599,47 @@ class DataCollectionService:
             "conversion_rate": 0.0,
             "preferred_regions": []
         }
+        
+        # Per-session rollup as a CTE, then one row of totals over it,
+        # so no event rows are shipped back to Python
+        sessions = (
+            select(
+                Event.session_id,
+                func.count().label("events"),
+                (func.max(Event.timestamp) - func.min(Event.timestamp)).label("duration"),
+                func.count(case((Event.event_type == EventType.LISTING_VIEW.value, 1))).label("views"),
+                func.count(case((Event.event_type == EventType.DEAL_COMPLETED.value, 1))).label("deals")
+            )
+            .where(
+                Event.user_id == user_id,
+                Event.timestamp >= datetime.utcnow() - timedelta(days=days)
+            )
+            .group_by(Event.session_id)
+            .cte("user_sessions")
+        )
+        query = select(
+            func.coalesce(func.sum(sessions.c.events), 0),
+            func.count(),
+            func.avg(func.extract("epoch", sessions.c.duration)),
+            func.coalesce(func.sum(sessions.c.views), 0),
+            func.coalesce(func.sum(sessions.c.deals), 0)
+        ).select_from(sessions)
+        
+        try:
+            async with AsyncSessionLocal() as session:
+                total_events, sessions_count, avg_duration, views, deals = (await session.execute(query)).one()
+        except Exception as e:
+            logger.error(f"Failed to load analytics for user {user_id}: {e}")
+            return analytics
+        
+        # SUM and AVG come back as Decimal; cast so the response serializes as plain numbers
+        analytics.update({
+            "total_events": int(total_events),
+            "sessions_count": int(sessions_count),
+            "avg_session_duration": float(avg_duration or 0),
+            "conversion_rate": float(deals) / float(views) if views else 0.0
+        })
+        return analytics
     
     async def get_market_intelligence(
         self,
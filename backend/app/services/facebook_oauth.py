@@ -17,6 +17,8 @@ import base64
 import hashlib
 import hmac
 
+from app.services.http_session import get_http_session
+
 logger = logging.getLogger(__name__)
 
 # Process-level store for OAuth state (fallback if Redis not available)
@@ -96,12 +98,12 @@ class FacebookOAuthService:
         # State is kept in module-level STATE_STORE
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        # Borrow the shared session; it outlives this service and is closed on app shutdown
+        self.session = get_http_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        self.session = None
     
     def generate_authorization_url(self, user_id: str, additional_scopes: List[str] = None) -> str:
         """
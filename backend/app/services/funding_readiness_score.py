@@ -5,9 +5,8 @@ Calculates a 0-100 score based on multiple factors
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 from datetime import datetime, timedelta
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 import logging
-import uuid
 
 from app.models.gep_models import (
     GEPMember, GEPPost, GEPProduct, GEPGrowthMetric,
@@ -34,7 +33,11 @@ class FundingReadinessCalculator:
     
     @staticmethod
     async def calculate_score(member_id: str, db: AsyncSession) -> Dict[str, Any]:
-        """Calculate comprehensive funding readiness score"""
+        """Calculate comprehensive funding readiness score.
+        
+        Updates the member on db without committing; the caller commits (together with
+        any other writes) and then calls invalidate_member.
+        """
         
         # Get member
         result = await db.execute(
@@ -72,13 +75,16 @@ class FundingReadinessCalculator:
         score_breakdown["follower_growth"] = follower_score
         total_score += follower_score
         
+        # Published and priced product counts come from one aggregate query
+        product_count, priced_products = await FundingReadinessCalculator._count_products(member_id, db)
+        
         # 6. Revenue Signals (0-10 points)
-        revenue_score = await FundingReadinessCalculator._calculate_revenue_signals(member_id, db)
+        revenue_score = FundingReadinessCalculator._calculate_revenue_signals(priced_products)
         score_breakdown["revenue_signals"] = revenue_score
         total_score += revenue_score
         
         # 7. Product Catalog (0-10 points)
-        product_score = await FundingReadinessCalculator._calculate_product_catalog(member_id, db)
+        product_score = FundingReadinessCalculator._calculate_product_catalog(product_count)
         score_breakdown["product_catalog"] = product_score
         total_score += product_score
         
@@ -98,7 +104,6 @@ class FundingReadinessCalculator:
         # Update member record
         member.funding_readiness_score = int(total_score)
         member.funding_status = status
-        await db.commit()
         
         return {
             "score": int(total_score),
@@ -191,32 +196,27 @@ class FundingReadinessCalculator:
         # Get total engagement on member's posts (last 30 days)
         thirty_days_ago = datetime.now() - timedelta(days=30)
         
-        # Get posts
+        # Count posts, likes and comments in one round trip; the post ids stay in SQL
+        recent_posts = select(GEPPost.id).where(
+            GEPPost.member_id == member_id,
+            GEPPost.created_at >= thirty_days_ago
+        )
         result = await db.execute(
-            select(GEPPost.id).where(
-                GEPPost.member_id == member_id,
-                GEPPost.created_at >= thirty_days_ago
+            select(
+                select(func.count()).select_from(recent_posts.subquery()).scalar_subquery(),
+                select(func.count(GEPPostLike.id))
+                .where(GEPPostLike.post_id.in_(recent_posts))
+                .scalar_subquery(),
+                select(func.count(GEPPostComment.id))
+                .where(GEPPostComment.post_id.in_(recent_posts))
+                .scalar_subquery()
             )
         )
-        post_ids = [str(row[0]) for row in result.all()]
+        post_count, total_likes, total_comments = result.one()
         
-        if not post_ids:
+        if not post_count:
             return 0.0
         
-        # Count total likes received
-        result = await db.execute(
-            select(func.count(GEPPostLike.id))
-            .where(GEPPostLike.post_id.in_([uuid.UUID(pid) for pid in post_ids]))
-        )
-        total_likes = result.scalar() or 0
-        
-        # Count total comments received
-        result = await db.execute(
-            select(func.count(GEPPostComment.id))
-            .where(GEPPostComment.post_id.in_([uuid.UUID(pid) for pid in post_ids]))
-        )
-        total_comments = result.scalar() or 0
-        
         # Calculate engagement score
         total_engagement = total_likes + (total_comments * 2)  # Comments worth 2x
         
@@ -252,19 +252,24 @@ class FundingReadinessCalculator:
             return 1.0
     
     @staticmethod
-    async def _calculate_revenue_signals(member_id: str, db: AsyncSession) -> float:
-        """Calculate revenue signals score (0-10)"""
-        # Count products with pricing
+    async def _count_products(member_id: str, db: AsyncSession) -> Tuple[int, int]:
+        """Count published products and how many of them have pricing, in a single pass"""
         result = await db.execute(
-            select(func.count(GEPProduct.id))
+            select(
+                func.count(GEPProduct.id),
+                func.count(GEPProduct.id).filter(GEPProduct.price.isnot(None))
+            )
             .where(
                 GEPProduct.member_id == member_id,
-                GEPProduct.price.isnot(None),
                 GEPProduct.status == 'published'
             )
         )
-        priced_products = result.scalar() or 0
-        
+        product_count, priced_products = result.one()
+        return product_count or 0, priced_products or 0
+    
+    @staticmethod
+    def _calculate_revenue_signals(priced_products: int) -> float:
+        """Calculate revenue signals score (0-10)"""
         # Scoring: 5+ = 10, 3-4 = 7, 1-2 = 4, 0 = 0
         if priced_products >= 5:
             return 10.0
@@ -276,17 +281,8 @@ class FundingReadinessCalculator:
             return 0.0
     
     @staticmethod
-    async def _calculate_product_catalog(member_id: str, db: AsyncSession) -> float:
+    def _calculate_product_catalog(product_count: int) -> float:
         """Calculate product catalog score (0-10)"""
-        result = await db.execute(
-            select(func.count(GEPProduct.id))
-            .where(
-                GEPProduct.member_id == member_id,
-                GEPProduct.status == 'published'
-            )
-        )
-        product_count = result.scalar() or 0
-        
         # Scoring: 10+ = 10, 5-9 = 7, 2-4 = 4, 1 = 2, 0 = 0
         if product_count >= 10:
             return 10.0
@@ -0,0 +1,37 @@
+"""
+Shared aiohttp session for outbound API calls (Facebook Graph API)
+
+One ClientSession keeps its connection pool, DNS cache and TLS sessions alive
+across requests; it is created lazily on first use and closed on app shutdown.
+"""
+
+import logging
+from typing import Optional
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+# Cap concurrent sockets so bursts queue in the pool instead of tripping Graph API rate limits
+MAX_CONNECTIONS = 100
+MAX_CONNECTIONS_PER_HOST = 20
+
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Get the application-wide ClientSession, creating it on first use"""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=MAX_CONNECTIONS, limit_per_host=MAX_CONNECTIONS_PER_HOST)
+        )
+    return _session
+
+
+async def close_http_session() -> None:
+    """Close the shared ClientSession (called from the app lifespan on shutdown)"""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+        logger.info("HTTP client session closed")
+    _session = None
@@ -9,11 +9,17 @@ from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, desc
 from sqlalchemy.dialects.postgresql import insert
+import asyncio
 import json
 import logging
 
+from app.core.database import AsyncSessionLocal
+
 logger = logging.getLogger(__name__)
 
+# Strong references to in-flight learning profile refreshes so they aren't garbage collected
+_pending_refreshes: set = set()
+
 
 class LearningService:
     """Service that learns from user behavior and personalizes AI assistant"""
@@ -68,7 +74,9 @@ class LearningService:
             await self.db.commit()
             
             # Trigger learning update (async, non-blocking)
-            await self._update_learning_profile(profile)
+            refresh = asyncio.create_task(self._refresh_learning_profile(profile))
+            _pending_refreshes.add(refresh)
+            refresh.add_done_callback(_pending_refreshes.discard)
             
             return True
         except Exception as e:
@@ -76,6 +84,12 @@ class LearningService:
             await self.db.rollback()
             return False
     
+    @staticmethod
+    async def _refresh_learning_profile(profile_id: str):
+        """Update the learning profile in its own session, after the request's session is closed"""
+        async with AsyncSessionLocal() as db:
+            await LearningService(db)._update_learning_profile(profile_id)
+    
     async def _update_learning_profile(self, profile_id: str):
         """Update learning profile based on recent interactions"""
         try:
@@ -4,46 +4,23 @@ Uses OpenAI to generate professional pitch decks from user input
 """
 import os
 import json
+import hashlib
 import logging
 import asyncio
+import orjson
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from openai import OpenAI
 
+from app.services.cache import cache_get, cache_set
+
 logger = logging.getLogger(__name__)
 
+# Bump when the prompts change so decks cached under the old wording are not reused
+PITCHDECK_PROMPT_VERSION = "v1"
+PITCHDECK_CACHE_TTL = 24 * 60 * 60
 
-class PitchDeckGenerator:
-    """Generate pitch decks using OpenAI"""
-    
-    def __init__(self):
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY not found in environment variables")
-        
-        self.client = OpenAI(api_key=api_key)
-        self.model = "gpt-4o"  # Use GPT-4 for better quality
-    
-    async def generate_pitch_deck(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Generate a complete pitch deck from user input.
-        
-        Args:
-            input_data: Dictionary containing:
-                - companyName: Company name
-                - tagline: Company tagline
-                - problem: Problem statement
-                - solution: Solution description
-                - marketSize: Market size information
-                - businessModel: Business model
-                - traction: Traction/metrics
-                - team: Team information
-                - ask: Funding ask
-        
-        Returns:
-            Dictionary containing structured pitch deck with slides
-        """
-        try:
-            system_prompt = """You are an expert pitch deck consultant. Generate a professional, investor-ready pitch deck in JSON format.
+PITCHDECK_SYSTEM_PROMPT = """You are an expert pitch deck consultant. Generate a professional, investor-ready pitch deck in JSON format.
 
 The pitch deck should follow the standard structure:
 1. Title Slide (company name, tagline, logo placeholder)
@@ -77,20 +54,71 @@ Return a JSON object with this structure:
 }
 
 Make it professional, compelling, and investor-ready. Use clear, concise language."""
-            
-            user_prompt = f"""Generate a pitch deck for:
-
-Company Name: {input_data.get('companyName', 'N/A')}
-Tagline: {input_data.get('tagline', 'N/A')}
-Problem: {input_data.get('problem', 'N/A')}
-Solution: {input_data.get('solution', 'N/A')}
-Market Size: {input_data.get('marketSize', 'N/A')}
-Business Model: {input_data.get('businessModel', 'N/A')}
-Traction: {input_data.get('traction', 'N/A')}
-Team: {input_data.get('team', 'N/A')}
-Funding Ask: {input_data.get('ask', 'N/A')}
+
+# Only the user prompt varies per request; the system prompt is a stable prefix for provider-side prompt caching
+PITCHDECK_PROMPT_FIELDS = ("companyName", "tagline", "problem", "solution", "marketSize", "businessModel", "traction", "team", "ask")
+PITCHDECK_USER_PROMPT_TEMPLATE = """Generate a pitch deck for:
+
+Company Name: {companyName}
+Tagline: {tagline}
+Problem: {problem}
+Solution: {solution}
+Market Size: {marketSize}
+Business Model: {businessModel}
+Traction: {traction}
+Team: {team}
+Funding Ask: {ask}
 
 Generate a complete, professional pitch deck with all 10 slides. Return ONLY valid JSON, no markdown formatting."""
+
+
+def _pitchdeck_cache_key(input_data: Dict[str, Any]) -> str:
+    """Content-addressed key for a deck: hash of the prompt version and the user's answers"""
+    payload = json.dumps(input_data, sort_keys=True, separators=(',', ':'), default=str)
+    digest = hashlib.sha256(f"{PITCHDECK_PROMPT_VERSION}|{payload}".encode()).hexdigest()
+    return f"pitchdeck:{digest}"
+
+
+class PitchDeckGenerator:
+    """Generate pitch decks using OpenAI"""
+    
+    def __init__(self):
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY not found in environment variables")
+        
+        self.client = OpenAI(api_key=api_key)
+        self.model = "gpt-4o"  # Use GPT-4 for better quality
+    
+    async def generate_pitch_deck(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Generate a complete pitch deck from user input.
+        
+        Args:
+            input_data: Dictionary containing:
+                - companyName: Company name
+                - tagline: Company tagline
+                - problem: Problem statement
+                - solution: Solution description
+                - marketSize: Market size information
+                - businessModel: Business model
+                - traction: Traction/metrics
+                - team: Team information
+                - ask: Funding ask
+        
+        Returns:
+            Dictionary containing structured pitch deck with slides
+        """
+        cache_key = _pitchdeck_cache_key(input_data)
+        cached_deck = cache_get(cache_key, PITCHDECK_CACHE_TTL)
+        if cached_deck is not None:
+            logger.info(f"Reusing cached pitch deck for: {input_data.get('companyName', 'Unknown')}")
+            return cached_deck
+        
+        try:
+            user_prompt = PITCHDECK_USER_PROMPT_TEMPLATE.format(
+                **{field: input_data.get(field, 'N/A') for field in PITCHDECK_PROMPT_FIELDS}
+            )
             
             logger.info(f"Generating pitch deck for: {input_data.get('companyName', 'Unknown')}")
             
@@ -101,7 +129,7 @@ Generate a complete, professional pitch deck with all 10 slides. Return ONLY val
                 lambda: self.client.chat.completions.create(
                     model=self.model,
                     messages=[
-                        {"role": "system", "content": system_prompt},
+                        {"role": "system", "content": PITCHDECK_SYSTEM_PROMPT},
                         {"role": "user", "content": user_prompt}
                     ],
                     temperature=0.7,
@@ -114,10 +142,11 @@ Generate a complete, professional pitch deck with all 10 slides. Return ONLY val
             
             # Parse JSON response
             try:
-                deck_json = json.loads(result_text)
+                deck_json = orjson.loads(result_text)
                 logger.info(f"Successfully generated pitch deck with {len(deck_json.get('slides', []))} slides")
+                cache_set(cache_key, deck_json, PITCHDECK_CACHE_TTL)
                 return deck_json
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.error(f"Failed to parse JSON response: {e}")
                 logger.error(f"Response was: {result_text[:500]}")
                 # Fallback: create a basic structure
@@ -190,3 +219,9 @@ Generate a complete, professional pitch deck with all 10 slides. Return ONLY val
                 "total_slides": 8
             }
         }
+
+
+@lru_cache(maxsize=1)
+def get_pitchdeck_generator() -> PitchDeckGenerator:
+    """Shared generator so the OpenAI client and its connection pool are reused across requests"""
+    return PitchDeckGenerator()
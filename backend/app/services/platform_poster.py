@@ -62,31 +62,31 @@ class PlatformPoster:
         Returns:
             List of posting results for each platform
         """
-        results = []
+        # Platforms are independent, so post to all of them concurrently
+        return list(await asyncio.gather(
+            *(self._post_to_platform(platform_name, listing_data) for platform_name in platforms)
+        ))
+    
+    async def _post_to_platform(self, platform_name: str, listing_data: ListingData) -> PostingResult:
+        """Post a listing to a single platform, turning failures into a PostingResult"""
+        if platform_name not in self.platforms:
+            return PostingResult(
+                success=False,
+                platform=platform_name,
+                error_message=f"Platform {platform_name} not supported"
+            )
         
-        for platform_name in platforms:
-            if platform_name not in self.platforms:
-                results.append(PostingResult(
-                    success=False,
-                    platform=platform_name,
-                    error_message=f"Platform {platform_name} not supported"
-                ))
-                continue
+        try:
+            poster = self.platforms[platform_name]
+            return await poster.post_listing(listing_data)
             
-            try:
-                poster = self.platforms[platform_name]
-                result = await poster.post_listing(listing_data)
-                results.append(result)
-                
-            except Exception as e:
-                logger.error(f"Error posting to {platform_name}: {str(e)}")
-                results.append(PostingResult(
-                    success=False,
-                    platform=platform_name,
-                    error_message=str(e)
-                ))
-        
-        return results
+        except Exception as e:
+            logger.error(f"Error posting to {platform_name}: {str(e)}")
+            return PostingResult(
+                success=False,
+                platform=platform_name,
+                error_message=str(e)
+            )
 
 class FacebookMarketplacePoster:
     """Facebook Marketplace posting implementation"""
@@ -5,14 +5,24 @@ Provides real-time access to successful listings and market intelligence
 to enhance AI responses with actual data from successful sales.
 """
 
+import heapq
 import json
 import os
+from operator import itemgetter
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Price multipliers by listing condition (unknown conditions are neutral)
+CONDITION_PRICE_FACTORS = {
+    "excellent": 1.05,
+    "good": 1.0,
+    "fair": 0.9,
+    "poor": 0.8
+}
+
 class RAGService:
     """
     RAG Service that provides access to successful listings and market data
@@ -26,7 +36,11 @@ class RAGService:
         """Load successful listings data"""
         try:
             with open(self.data_file, 'r') as f:
-                return json.load(f)
+                data = json.load(f)
+            # Default sold_date at load time so ranking can use a C-level itemgetter key
+            for listing in data.get("successful_listings", []):
+                listing.setdefault("sold_date", "")
+            return data
         except Exception as e:
             logger.error(f"Failed to load RAG data: {e}")
             return {"successful_listings": [], "market_trends": {}, "success_patterns": {}}
@@ -44,22 +58,19 @@ class RAGService:
         Returns:
             List of similar successful listings
         """
-        similar_listings = []
-        
-        for listing in self.data.get("successful_listings", []):
-            # Check if it's the same make/model
-            if (listing.get("make", "").lower() == make.lower() and 
-                listing.get("model", "").lower() == model.lower()):
-                
-                # Check if year is within 2 years
-                year_diff = abs(listing.get("year", 0) - year)
-                if year_diff <= 2:
-                    similar_listings.append(listing)
-        
-        # Sort by most recent sales
-        similar_listings.sort(key=lambda x: x.get("sold_date", ""), reverse=True)
-        
-        return similar_listings[:3]  # Return top 3 most similar
+        make = make.lower()
+        model = model.lower()
+        
+        # Same make/model, year within 2 years
+        similar_listings = (
+            listing for listing in self.data.get("successful_listings", [])
+            if listing.get("make", "").lower() == make
+            and listing.get("model", "").lower() == model
+            and abs(listing.get("year", 0) - year) <= 2
+        )
+        
+        # Top 3 most recent sales, without sorting every match
+        return heapq.nlargest(3, similar_listings, key=itemgetter("sold_date"))
     
     def get_market_insights(self, make: str, model: str, location: str = "Detroit, MI") -> Dict[str, Any]:
         """
@@ -118,12 +129,13 @@ class RAGService:
                 "confidence": 0.0
             }
         
+        listing_count = len(similar_listings)
+        
         # Calculate average sold price
-        sold_prices = [listing.get("sold_price", 0) for listing in similar_listings]
-        avg_sold_price = sum(sold_prices) / len(sold_prices)
+        avg_sold_price = sum(listing.get("sold_price", 0) for listing in similar_listings) / listing_count
         
         # Adjust for mileage
-        avg_mileage = sum([listing.get("mileage", 0) for listing in similar_listings]) / len(similar_listings)
+        avg_mileage = sum(listing.get("mileage", 0) for listing in similar_listings) / listing_count
         mileage_factor = 1.0
         
         if mileage > avg_mileage:
@@ -136,21 +148,15 @@ class RAGService:
             mileage_factor = 1.0 + (mileage_diff * 0.1)  # 10% increase per 10% lower mileage
         
         # Adjust for condition
-        condition_factors = {
-            "excellent": 1.05,
-            "good": 1.0,
-            "fair": 0.9,
-            "poor": 0.8
-        }
-        condition_factor = condition_factors.get(condition.lower(), 1.0)
+        condition_factor = CONDITION_PRICE_FACTORS.get(condition.lower(), 1.0)
         
         # Calculate recommended price
         recommended_price = avg_sold_price * mileage_factor * condition_factor
         
         return {
             "recommended_price": round(recommended_price, 2),
-            "market_analysis": f"Based on {len(similar_listings)} similar successful sales",
-            "confidence": min(0.9, len(similar_listings) * 0.2),  # Higher confidence with more data
+            "market_analysis": f"Based on {listing_count} similar successful sales",
+            "confidence": min(0.9, listing_count * 0.2),  # Higher confidence with more data
             "similar_listings": similar_listings,
             "pricing_factors": {
                 "avg_sold_price": avg_sold_price,
@@ -172,11 +178,12 @@ class RAGService:
             Formatted insights string for demo
         """
         similar_listings = self.get_similar_successful_listings(make, model, year)
-        market_insights = self.get_market_insights(make, model)
         
         if not similar_listings:
             return f"No recent successful sales data for {year} {make} {model} in your area."
         
+        market_insights = self.get_market_insights(make, model)
+        
         # Get the most recent successful sale
         recent_sale = similar_listings[0]
         
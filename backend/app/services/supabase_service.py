@@ -56,12 +56,13 @@ class SupabaseService:
                 }
             
             # Prepare data for Supabase
+            car_info = analysis_data.get("car_info") or {}
             car_analysis_record = {
                 "user_id": "test_user",  # For demo purposes
                 "image_urls": [],  # Will be populated with actual image URLs
-                "make": analysis_data.get("car_info", {}).get("make"),
-                "model": analysis_data.get("car_info", {}).get("model"),
-                "year": analysis_data.get("car_info", {}).get("year"),
+                "make": car_info.get("make"),
+                "model": car_info.get("model"),
+                "year": car_info.get("year"),
                 "mileage": None,  # Will be extracted from analysis
                 "condition": "good",  # Default
                 "title_status": "clean",  # Default
@@ -9,6 +9,8 @@ import json
 from typing import Dict, Any, Optional
 from urllib.parse import urlparse
 
+from app.services.http_session import get_http_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -81,44 +83,44 @@ async def post_to_facebook(
                 post_data["link"] = media_url
         
         # Make POST request to Facebook Graph API
-        async with aiohttp.ClientSession() as session:
-            async with session.post(endpoint, data=post_data) as response:
-                response_data = await response.json()
+        session = get_http_session()
+        async with session.post(endpoint, data=post_data) as response:
+            response_data = await response.json()
+            
+            if response.status == 200 and "id" in response_data:
+                # Success - extract post ID
+                post_id = response_data["id"]
                 
-                if response.status == 200 and "id" in response_data:
-                    # Success - extract post ID
-                    post_id = response_data["id"]
-                    
-                    # Construct post URL
-                    # Format: https://www.facebook.com/{post_id}
-                    # For pages: https://www.facebook.com/{page_id}/posts/{post_id}
-                    if page_id:
-                        post_url = f"https://www.facebook.com/{page_id}/posts/{post_id.split('_')[-1]}"
-                    else:
-                        # For user timeline posts, we need to get the user ID from the token
-                        # For now, use a generic format
-                        post_url = f"https://www.facebook.com/{post_id}"
-                    
-                    return {
-                        "success": True,
-                        "post_id": post_id,
-                        "post_url": post_url,
-                        "facebook_response": response_data
-                    }
+                # Construct post URL
+                # Format: https://www.facebook.com/{post_id}
+                # For pages: https://www.facebook.com/{page_id}/posts/{post_id}
+                if page_id:
+                    post_url = f"https://www.facebook.com/{page_id}/posts/{post_id.split('_')[-1]}"
                 else:
-                    # Error from Facebook API
-                    error_message = response_data.get("error", {}).get("message", "Unknown Facebook API error")
-                    error_code = response_data.get("error", {}).get("code", response.status)
-                    
-                    logger.error(f"Facebook API error: {error_code} - {error_message}")
-                    
-                    return {
-                        "success": False,
-                        "error": error_message,
-                        "error_code": error_code,
-                        "facebook_response": response_data
-                    }
-                    
+                    # For user timeline posts, we need to get the user ID from the token
+                    # For now, use a generic format
+                    post_url = f"https://www.facebook.com/{post_id}"
+                
+                return {
+                    "success": True,
+                    "post_id": post_id,
+                    "post_url": post_url,
+                    "facebook_response": response_data
+                }
+            else:
+                # Error from Facebook API
+                error_message = response_data.get("error", {}).get("message", "Unknown Facebook API error")
+                error_code = response_data.get("error", {}).get("code", response.status)
+                
+                logger.error(f"Facebook API error: {error_code} - {error_message}")
+                
+                return {
+                    "success": False,
+                    "error": error_message,
+                    "error_code": error_code,
+                    "facebook_response": response_data
+                }
+                
     except aiohttp.ClientError as e:
         logger.error(f"HTTP error posting to Facebook: {str(e)}")
         return {
@@ -53,6 +53,11 @@ TRIM_TIER_KEYWORDS: Dict[str, List[str]] = {
     ],
 }
 
+TRIM_TIER_LABELS: Dict[str, str] = {
+    "mid": "Mid Trim",
+    "high": "High Trim",
+}
+
 TRIM_TIER_PERCENT_RANGE: Dict[str, Tuple[float, float]] = {
     "base": (0.0, 0.0),
     "mid": (0.05, 0.08),   # +5% to +8%
@@ -139,6 +144,17 @@ FEATURE_CATEGORY_MAP: Dict[str, Dict[str, object]] = {
 
 MAX_FEATURE_BONUS_PERCENT = 0.12  # Hard cap of +12% uplift from features
 
+# FEATURE_CATEGORY_MAP unpacked once: (category, (keyword, lowercased keyword) pairs, percent, label)
+FEATURE_CATEGORY_RULES: List[Tuple[str, Tuple[Tuple[str, str], ...], float, str]] = [
+    (
+        category,
+        tuple((keyword, keyword.lower()) for keyword in data.get("keywords", [])),  # type: ignore
+        data.get("percent", 0.0),  # type: ignore
+        data.get("label", category.title()),  # type: ignore
+    )
+    for category, data in FEATURE_CATEGORY_MAP.items()
+]
+
 
 def normalize_title_status(value: Optional[str]) -> str:
     """Normalize a title status string to a canonical lowercase form."""
@@ -190,12 +206,11 @@ def get_trim_adjustment_percent(tier: str, match_count: int = 1, trim: Optional[
     - LT: +4% to +7% (average 5.5%)
     - LTZ: +10% to +15% (average 12.5%)
     """
-    if trim and isinstance(trim, str) and model and isinstance(model, str):
-        trim_lower = trim.lower()
-        model_lower = model.lower()
-        
+    # Normalise once; both the Malibu and Sport checks reuse it
+    trim_lower = trim.lower() if trim and isinstance(trim, str) else ""
+    if trim_lower and model and isinstance(model, str):
         # Malibu-specific trim adjustments
-        if "malibu" in model_lower:
+        if "malibu" in model.lower():
             if "ltz" in trim_lower or "premier" in trim_lower:
                 return 0.125  # LTZ: +10% to +15% (average 12.5%)
             elif "lt" in trim_lower and "ltz" not in trim_lower:
@@ -204,7 +219,7 @@ def get_trim_adjustment_percent(tier: str, match_count: int = 1, trim: Optional[
                 return 0.0  # LS: baseline (0%)
     
     # Detroit-specific: Sport trim gets +3%
-    if trim and isinstance(trim, str) and "sport" in trim.lower():
+    if "sport" in trim_lower:
         return 0.03
     
     range_low, range_high = TRIM_TIER_PERCENT_RANGE.get(tier, (0.0, 0.0))
@@ -224,11 +239,10 @@ def get_trim_adjustment_percent(tier: str, match_count: int = 1, trim: Optional[
 def format_trim_tier_label(tier: str, trim_value: Optional[str], matches: List[str]) -> str:
     if tier == "base":
         return "Base Trim (no premium keywords detected)"
-    if tier == "mid":
-        return f"Mid Trim ({', '.join(matches) if matches else trim_value})"
-    if tier == "high":
-        return f"High Trim ({', '.join(matches) if matches else trim_value})"
-    return "Unknown Trim Tier"
+    label = TRIM_TIER_LABELS.get(tier)
+    if label is None:
+        return "Unknown Trim Tier"
+    return f"{label} ({', '.join(matches) if matches else trim_value})"
 
 
 def get_reliability_tier(make: Optional[str]) -> str:
@@ -283,19 +297,15 @@ def calculate_feature_bonus(features: List[str]) -> Tuple[float, List[Dict[str,
     total_percent = 0.0
     breakdown: List[Dict[str, object]] = []
 
-    for category, data in FEATURE_CATEGORY_MAP.items():
-        keywords: List[str] = data.get("keywords", [])  # type: ignore
-        percent: float = data.get("percent", 0.0)  # type: ignore
-        label: str = data.get("label", category.title())  # type: ignore
-        matched_keyword = None
-        for keyword in keywords:
-            keyword_lower = keyword.lower()
-            for feature in normalized_features:
-                if keyword_lower in feature:
-                    matched_keyword = keyword
-                    break
-            if matched_keyword:
-                break
+    for category, keywords, percent, label in FEATURE_CATEGORY_RULES:
+        matched_keyword = next(
+            (
+                keyword
+                for keyword, keyword_lower in keywords
+                if any(keyword_lower in feature for feature in normalized_features)
+            ),
+            None,
+        )
         if matched_keyword:
             total_percent += percent
             breakdown.append(
@@ -0,0 +1,18 @@
+-- Community Feed Query Indexes
+-- Composite indexes matching the feed, like and comment queries in community_feed.py
+
+-- Feed: WHERE is_published ORDER BY created_at DESC, id DESC
+-- Partial index so unpublished posts never enter the scan
+CREATE INDEX IF NOT EXISTS idx_gep_posts_published_created_at
+    ON gep_posts(created_at DESC, id DESC)
+    WHERE is_published;
+
+-- Comments for a post, oldest first: WHERE post_id = ? ORDER BY created_at, id
+CREATE INDEX IF NOT EXISTS idx_gep_post_comments_post_created_at
+    ON gep_post_comments(post_id, created_at, id);
+
+-- Like toggle: WHERE post_id = ? AND member_id = ?
+-- Already served by the UNIQUE (post_id, member_id) constraint on gep_post_likes
+
+-- The single-column index is a prefix of the comments composite above
+DROP INDEX IF EXISTS idx_gep_post_comments_post_id;
@@ -0,0 +1,22 @@
+-- Analytics Events
+-- Table written in batches by DataCollectionService (see app/models/user.py Event)
+
+CREATE TABLE IF NOT EXISTS events (
+    event_id SERIAL PRIMARY KEY,
+    event_type VARCHAR(100),
+    event_detail TEXT,
+    user_id VARCHAR(255), -- Supabase user UUIDs, stored as text
+    session_id VARCHAR(255),
+    car_id INTEGER,
+    timestamp TIMESTAMP DEFAULT NOW(),
+    platform VARCHAR(50),
+    page VARCHAR(255),
+    element VARCHAR(255),
+    referrer TEXT
+);
+
+-- Earlier deployments created user_id as INTEGER, which cannot hold user UUIDs
+ALTER TABLE events ALTER COLUMN user_id TYPE VARCHAR(255) USING user_id::VARCHAR;
+
+-- Per-user analytics: WHERE user_id = ? AND timestamp >= ?
+CREATE INDEX IF NOT EXISTS idx_events_user_id_timestamp ON events(user_id, timestamp);
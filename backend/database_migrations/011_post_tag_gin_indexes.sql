@@ -0,0 +1,6 @@
+-- Community Post Tag Indexes
+-- hashtags / mentions are native TEXT[] columns; GIN indexes make containment
+-- lookups (hashtags @> ARRAY['tag']) index scans instead of full table scans
+
+CREATE INDEX IF NOT EXISTS idx_gep_posts_hashtags ON gep_posts USING GIN (hashtags);
+CREATE INDEX IF NOT EXISTS idx_gep_posts_mentions ON gep_posts USING GIN (mentions);
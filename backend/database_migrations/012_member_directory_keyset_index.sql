@@ -0,0 +1,12 @@
+-- Member Directory Keyset Index
+-- Directory search pages with WHERE (COALESCE(funding_readiness_score, 0), id) < (?, ?)
+-- ORDER BY COALESCE(funding_readiness_score, 0) DESC, id DESC; the id tiebreaker makes each
+-- position unique and COALESCE keeps unscored members in the paging order
+
+DROP INDEX IF EXISTS idx_gep_members_funding_score_id;
+CREATE INDEX IF NOT EXISTS idx_gep_members_funding_score_id
+    ON gep_members((COALESCE(funding_readiness_score, 0)) DESC, id DESC);
+
+-- Top performers and the min/max score filters use the raw column; restore its index
+-- where an earlier revision of this migration dropped it
+CREATE INDEX IF NOT EXISTS idx_gep_members_funding_score ON gep_members(funding_readiness_score DESC);
@@ -0,0 +1,76 @@
+"""
+Shared test fixtures: in-memory SQLite databases for the app's models, served through get_db
+"""
+import asyncio
+import os
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import ARRAY
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.pool import StaticPool
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.main import app
+from app.core.database import Base, get_db
+from app.services.cache import cache_clear
+
+
+# The models use PostgreSQL column types; render them as plain SQLite columns for the tests
+@compiles(UUID, "sqlite")
+def _uuid_sqlite(type_, compiler, **kw):
+    return "CHAR(32)"
+
+
+@compiles(ARRAY, "sqlite")
+def _array_sqlite(type_, compiler, **kw):
+    return "TEXT"
+
+
+def run(coro):
+    """Run a coroutine to completion from a synchronous test"""
+    return asyncio.run(coro)
+
+
+@pytest.fixture
+def make_db():
+    """Factory for an in-memory database holding the given model tables; returns its session maker"""
+    engines = []
+
+    def _make_db(*models):
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        engines.append(engine)
+
+        async def create_tables():
+            async with engine.begin() as conn:
+                await conn.run_sync(
+                    lambda sync_conn: Base.metadata.create_all(sync_conn, tables=[m.__table__ for m in models])
+                )
+
+        run(create_tables())
+        return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    yield _make_db
+    for engine in engines:
+        run(engine.dispose())
+
+
+@pytest.fixture
+def client_for():
+    """Factory for a TestClient whose get_db sessions come from the given session maker"""
+    def _client_for(session_factory):
+        async def override_get_db():
+            async with session_factory() as session:
+                yield session
+
+        app.dependency_overrides[get_db] = override_get_db
+        return TestClient(app, base_url="http://localhost")
+
+    cache_clear()
+    yield _client_for
+    app.dependency_overrides.clear()
+    cache_clear()
@@ -0,0 +1,112 @@
+"""
+Community feed: keyset pagination through the X-Next-Cursor header
+"""
+import asyncio
+import base64
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert
+
+from app.models.gep_models import GEPMember, GEPPost
+
+FEED_URL = "/api/v1/community/feed"
+
+
+@pytest.fixture
+def feed(make_db, client_for):
+    """Client over a feed of five published posts (two sharing a timestamp) and one draft.
+
+    Returns the client and the published post ids in feed order.
+    """
+    session_factory = make_db(GEPMember, GEPPost)
+    member_id = uuid.uuid4()
+    start = datetime(2024, 1, 1, 12, 0)
+    posts = [
+        {"id": uuid.uuid4(), "member_id": member_id, "content": f"post {i}", "post_type": "text",
+         "is_published": True, "created_at": start + timedelta(minutes=minutes)}
+        for i, minutes in enumerate([0, 1, 2, 2, 3])
+    ]
+    draft = {"id": uuid.uuid4(), "member_id": member_id, "content": "draft", "post_type": "text",
+             "is_published": False, "created_at": start + timedelta(minutes=10)}
+
+    async def seed():
+        async with session_factory() as session:
+            await session.execute(insert(GEPMember.__table__).values(
+                id=member_id, user_id=uuid.uuid4(), business_name="Acme", funding_status="Building"
+            ))
+            await session.execute(insert(GEPPost.__table__), posts + [draft])
+            await session.commit()
+
+    asyncio.run(seed())
+    expected = [str(p["id"]) for p in sorted(posts, key=lambda p: (p["created_at"], p["id"]), reverse=True)]
+    return client_for(session_factory), expected
+
+
+def _encode(text):
+    return base64.urlsafe_b64encode(text.encode()).decode()
+
+
+def test_feed_pages_through_next_cursor(feed):
+    client, expected = feed
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get(FEED_URL, params=params)
+        assert response.status_code == 200
+        seen += [post["id"] for post in response.json()]
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert seen == expected
+    assert pages == 3
+
+
+def test_feed_full_last_page_is_followed_by_an_empty_page(feed):
+    client, expected = feed
+
+    first = client.get(FEED_URL, params={"limit": len(expected)})
+    assert [post["id"] for post in first.json()] == expected
+
+    second = client.get(FEED_URL, params={"limit": len(expected), "cursor": first.headers["X-Next-Cursor"]})
+    assert second.status_code == 200
+    assert second.json() == []
+    assert "X-Next-Cursor" not in second.headers
+
+
+def test_feed_without_full_page_has_no_cursor(feed):
+    client, expected = feed
+
+    response = client.get(FEED_URL, params={"limit": 100})
+
+    assert [post["id"] for post in response.json()] == expected
+    assert "X-Next-Cursor" not in response.headers
+
+
+@pytest.mark.parametrize("cursor", [
+    "not-a-cursor!",
+    _encode("2024-01-01T12:00:00"),
+    _encode("yesterday|" + str(uuid.uuid4())),
+    _encode("2024-01-01T12:00:00|not-a-uuid"),
+])
+def test_feed_rejects_malformed_cursor(feed, cursor):
+    client, _ = feed
+
+    response = client.get(FEED_URL, params={"cursor": cursor})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("limit, status_code", [(0, 422), (-1, 422), (101, 422), (1, 200), (100, 200)])
+def test_feed_limit_bounds(feed, limit, status_code):
+    client, _ = feed
+
+    response = client.get(FEED_URL, params={"limit": limit})
+
+    assert response.status_code == status_code
@@ -0,0 +1,126 @@
+"""
+Event queue: bounded enqueue, batch writes with per-row retry, and log_action responses
+"""
+import asyncio
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from app.main import app
+from app.models.user import Event
+from app.services import data_collection_service as dcs
+
+
+@pytest.fixture
+def events_db(make_db):
+    return make_db(Event)
+
+
+@pytest.fixture
+def service(monkeypatch, events_db):
+    """A fresh DataCollectionService writing to the in-memory events table"""
+    monkeypatch.setattr(dcs, "AsyncSessionLocal", events_db)
+    return dcs.DataCollectionService()
+
+
+def _row(event_type="page_view", **fields):
+    return {"event_type": event_type, "timestamp": datetime.utcnow(), **fields}
+
+
+def _stored_events(events_db):
+    async def load():
+        async with events_db() as session:
+            result = await session.execute(select(Event.event_id, Event.event_type).order_by(Event.event_id))
+            return result.all()
+    return asyncio.run(load())
+
+
+def test_enqueue_sheds_events_when_queue_is_full(service):
+    service.event_queue = asyncio.Queue(maxsize=2)
+
+    assert service.enqueue_event(_row()) is True
+    assert service.enqueue_event(_row()) is True
+    assert service.enqueue_event(_row()) is False
+
+    assert service.event_queue.qsize() == 2
+    assert service.dropped_events == 1
+
+
+def test_enqueue_truncates_and_coerces_fields(service):
+    service.enqueue_event(_row(page="x" * 400, event_detail={"a": 1}, car_id="7", timestamp="not a date", unknown="y"))
+
+    row = service.event_queue.get_nowait()
+    assert len(row["page"]) == 255
+    assert row["event_detail"] == '{"a": 1}'
+    assert row["car_id"] is None
+    assert isinstance(row["timestamp"], datetime)
+    assert "unknown" not in row
+
+
+def test_write_events_inserts_batch(service, events_db):
+    asyncio.run(service._write_events([_row("a"), _row("b"), _row("c")]))
+
+    assert [event_type for _, event_type in _stored_events(events_db)] == ["a", "b", "c"]
+
+
+def test_write_events_retries_rows_individually_when_batch_fails(service, events_db):
+    asyncio.run(service._write_events([_row("existing", event_id=2)]))
+
+    # event_id 2 violates the primary key, failing the batch; only that row is lost
+    asyncio.run(service._write_events([_row("new", event_id=1), _row("new", event_id=2), _row("new", event_id=3)]))
+
+    assert _stored_events(events_db) == [(1, "new"), (2, "existing"), (3, "new")]
+
+
+def test_flush_events_drains_queue_in_batches(service, events_db):
+    service.event_batch_size = 2
+    for i in range(5):
+        service.enqueue_event(_row(f"event-{i}"))
+
+    asyncio.run(service.flush_events())
+
+    assert service.event_queue.empty()
+    assert len(_stored_events(events_db)) == 5
+
+
+@pytest.fixture
+def log_action_client(monkeypatch):
+    """TestClient with log_action queueing into a one-slot queue"""
+    monkeypatch.setattr(dcs.data_collection_service, "event_queue", asyncio.Queue(maxsize=1))
+    monkeypatch.setattr(dcs.data_collection_service, "dropped_events", 0)
+    return TestClient(app, base_url="http://localhost")
+
+
+def test_log_action_accepts_then_rejects_when_queue_is_full(log_action_client):
+    first = log_action_client.post("/api/v1/user/log_action", json={"action": "clear"})
+    second = log_action_client.post("/api/v1/user/log_action", json={"action": "clear"})
+
+    assert first.status_code == 202
+    assert second.status_code == 503
+    assert dcs.data_collection_service.dropped_events == 1
+
+
+def test_log_action_converts_offset_timestamps_to_utc(log_action_client):
+    response = log_action_client.post(
+        "/api/v1/user/log_action",
+        json={"action": "clear", "timestamp": "2024-01-01T12:00:00+02:00"}
+    )
+
+    assert response.status_code == 202
+    assert dcs.data_collection_service.event_queue.get_nowait()["timestamp"] == datetime(2024, 1, 1, 10, 0)
+
+
+@pytest.mark.parametrize("body", [
+    {},
+    {"action": ""},
+    {"action": "clear", "page": 3},
+    {"action": "clear", "user_id": [1]},
+    ["clear"],
+])
+def test_log_action_rejects_invalid_payloads(log_action_client, body):
+    response = log_action_client.post("/api/v1/user/log_action", json=body)
+
+    assert response.status_code == 422
+    assert dcs.data_collection_service.event_queue.empty()
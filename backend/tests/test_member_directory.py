@@ -0,0 +1,71 @@
+"""
+Member directory: keyset pagination with unscored (NULL) members
+"""
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy import insert
+
+from app.models.gep_models import GEPMember
+
+MEMBERS_URL = "/api/v1/members"
+
+
+@pytest.fixture
+def directory(make_db, client_for):
+    """Client over members with scores 80 and 40, a score of 0, and two NULL scores.
+
+    Returns the client and the (id, score) pairs in directory order: score descending
+    with NULL ranked as 0, then id descending.
+    """
+    session_factory = make_db(GEPMember)
+    members = [
+        {"id": uuid.uuid4(), "user_id": uuid.uuid4(), "business_name": f"Member {i}",
+         "funding_readiness_score": score, "funding_status": "Building"}
+        for i, score in enumerate([None, 80, 0, None, 40])
+    ]
+
+    async def seed():
+        async with session_factory() as session:
+            await session.execute(insert(GEPMember.__table__), members)
+            await session.commit()
+
+    asyncio.run(seed())
+    expected = [
+        (str(m["id"]), m["funding_readiness_score"]) for m in
+        sorted(members, key=lambda m: (m["funding_readiness_score"] or 0, m["id"]), reverse=True)
+    ]
+    return client_for(session_factory), expected
+
+
+def test_members_with_null_score_page_as_zero(directory):
+    client, expected = directory
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get(MEMBERS_URL, params=params)
+        assert response.status_code == 200
+        seen += [(member["id"], member["funding_readiness_score"]) for member in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert seen == expected
+    assert [score for _, score in seen[:2]] == [80, 40]
+
+
+def test_cursor_after_null_score_member_continues_paging(directory):
+    client, expected = directory
+    null_position = next(i for i, (_, score) in enumerate(expected) if score is None)
+
+    first = client.get(MEMBERS_URL, params={"limit": null_position + 1})
+    assert first.json()[-1]["funding_readiness_score"] is None
+
+    rest = client.get(MEMBERS_URL, params={"limit": 100, "cursor": first.headers["X-Next-Cursor"]})
+
+    assert rest.status_code == 200
+    assert [member["id"] for member in rest.json()] == [member_id for member_id, _ in expected[null_position + 1:]]
@@ -34,6 +34,24 @@ const SPELLING_CORRECTIONS: Record<string, string> = {
   'touchscreen': 'touchscreen', 'touch screen': 'touchscreen',
 };
 
+// Single alternation over every misspelling, rebuilt only when the dictionary changes.
+// Longer entries come first so phrases like 'sets of kyes' win over their words.
+let correctionPattern: RegExp | null = null;
+
+function getCorrectionPattern(): RegExp {
+  if (!correctionPattern) {
+    const alternatives = Object.keys(SPELLING_CORRECTIONS)
+      .sort((a, b) => b.length - a.length)
+      .map((wrong) => wrong.replace(/[.*+?^${}()|[\]\\]/g, '\\$&'));
+    correctionPattern = new RegExp(`\\b(?:${alternatives.join('|')})\\b`, 'gi');
+  }
+  return correctionPattern;
+}
+
+// Recently corrected strings (Map keeps insertion order, so the oldest entry is evicted first)
+const MAX_CACHED_CORRECTIONS = 1024;
+const correctionCache = new Map<string, string>();
+
 /**
  * Correct spelling in text
  * @param text - Text to correct
@@ -42,21 +60,28 @@ const SPELLING_CORRECTIONS: Record<string, string> = {
 export function correctSpelling(text: string): string {
   if (!text) return text;
   
-  let corrected = text;
+  const cached = correctionCache.get(text);
+  if (cached !== undefined) {
+    correctionCache.delete(text);
+    correctionCache.set(text, cached);
+    return cached;
+  }
   
-  // Apply corrections (case-insensitive, word boundaries)
-  Object.entries(SPELLING_CORRECTIONS).forEach(([wrong, correct]) => {
-    const regex = new RegExp(`\\b${wrong.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')}\\b`, 'gi');
-    corrected = corrected.replace(regex, (match) => {
-      // Preserve original case
-      if (match === match.toUpperCase()) return correct.toUpperCase();
-      if (match[0] === match[0].toUpperCase()) {
-        return correct.charAt(0).toUpperCase() + correct.slice(1);
-      }
-      return correct;
-    });
+  // Apply corrections in one pass (case-insensitive, word boundaries)
+  const corrected = text.replace(getCorrectionPattern(), (match) => {
+    const correct = SPELLING_CORRECTIONS[match.toLowerCase()] ?? match;
+    // Preserve original case
+    if (match === match.toUpperCase()) return correct.toUpperCase();
+    if (match[0] === match[0].toUpperCase()) {
+      return correct.charAt(0).toUpperCase() + correct.slice(1);
+    }
+    return correct;
   });
   
+  if (correctionCache.size >= MAX_CACHED_CORRECTIONS) {
+    correctionCache.delete(correctionCache.keys().next().value as string);
+  }
+  correctionCache.set(text, corrected);
   return corrected;
 }
 
@@ -67,6 +92,8 @@ export function correctSpelling(text: string): string {
  */
 export function addSpellingCorrection(wrong: string, correct: string): void {
   SPELLING_CORRECTIONS[wrong.toLowerCase()] = correct.toLowerCase();
+  correctionPattern = null;
+  correctionCache.clear();
 }
 
 